@@ -527,7 +527,7 @@ class MainWindow(wx.Frame):
     def stop_launch_process(self):
         """停止启动过程"""
         if hasattr(self, 'launcher'):
-            self.launcher.stop_event.set()
+            self.launcher.stop()
             self.add_log_message("[停止] 启动过程已停止")
 
     def on_pause_selection(self, event):
@@ -6,12 +6,14 @@ import cv2
 import numpy as np
 import time
 from typing import Optional, Tuple, List, Dict
-from util.EasyOCRTool import EasyOCRTool
 from util.ADBAppManager import ADBAppManager
 import uiautomator2 as u2
 
 
 class DaHuaXiYouGame:
+    # 活动/进程状态缓存有效期（秒），避免轮询时每次都走一次adb往返
+    STATE_CACHE_TTL = 0.5
+
     def __init__(self, adb_manager: ADBAppManager, hwnd: int, ocr_lang: str = 'ch_sim'):
         """
         大话西游游戏操作类 - 使用统一的ADB管理器
@@ -26,14 +28,32 @@ class DaHuaXiYouGame:
         self.app_name = "大话西游"
         self.adb_manager = adb_manager
         self.hwnd = hwnd
-        self.ocr_tool = EasyOCRTool(lang=ocr_lang)
+        self.ocr_lang = ocr_lang
+        self._ocr_tool = None  # 首次使用时再加载OCR模型
         self.game_package = "com.netease.dhxy"
 
+        # 状态缓存 (时间戳, 值)
+        self._activity_cache = (0.0, None)
+        self._running_cache = (0.0, False)
+
         # 初始化屏幕信息
         self.screen_width = 0
         self.screen_height = 0
         self._initialize_screen_info()
 
+    @property
+    def ocr_tool(self):
+        """
+        OCR工具（延迟加载，首次访问时才导入EasyOCR并加载模型）
+
+        Returns:
+            EasyOCRTool: OCR工具实例
+        """
+        if self._ocr_tool is None:
+            from util.EasyOCRTool import EasyOCRTool
+            self._ocr_tool = EasyOCRTool(lang=self.ocr_lang)
+        return self._ocr_tool
+
     def _initialize_screen_info(self) -> bool:
         """
         初始化屏幕信息
@@ -67,10 +87,10 @@ class DaHuaXiYouGame:
             Optional[np.ndarray]: 截图图像
         """
         try:
-            img = self.d.screenshot()
+            img = self.d.screenshot(format='opencv')
             if save_debug:
                 save_path = f"screenshot_hwnd_{self.hwnd}_{int(time.time())}.png"
-                if save_path and img:
+                if img is not None:
                     cv2.imwrite(save_path, img)
                     print(f"[成功] 句柄 {self.hwnd} 截图已保存: {save_path}")
 
@@ -99,7 +119,8 @@ class DaHuaXiYouGame:
         # 如果指定了区域，则裁剪图片
         if region is not None:
             x1, y1, x2, y2 = region
-            img = img[y1:y2, x1:x2]
+            # 只在这里生成一次连续内存的裁剪图，后续OCR不再复制
+            img = np.ascontiguousarray(img[y1:y2, x1:x2])
 
         # 使用OCR查找文本
         box = self.ocr_tool.find_text_position(img, target_text, threshold=confidence_threshold)
@@ -195,6 +216,7 @@ class DaHuaXiYouGame:
         try:
             url = f"127.0.0.1:{window_info['adb_port']}"
             self.d = u2.connect(url)  # 连接雷电实例
+            self._invalidate_state_cache()
             out = self.d.shell(f'pidof {self.game_package}').output
             if out.strip():
                 print("大话西游当前在运行")
@@ -218,8 +240,7 @@ class DaHuaXiYouGame:
         print("正在查找登陆游戏按钮")
         if box:
             point_x, point_y = box
-            x, y = np.int32(point_x), np.int32(point_y)
-            self.d.click(int(x), int(y))
+            self.d.click(point_x, point_y)
             return
 
         self.login_game()
@@ -245,19 +266,32 @@ class DaHuaXiYouGame:
         Returns:
             bool: 是否成功
         """
+        self._invalidate_state_cache()
         return self.adb_manager.stop_app(self.hwnd, self.game_package)
 
+    def _invalidate_state_cache(self):
+        """清空活动/进程状态缓存"""
+        self._activity_cache = (0.0, None)
+        self._running_cache = (0.0, False)
+
     def is_game_running(self) -> bool:
         """
-        检查游戏是否运行
+        检查游戏是否运行（结果缓存 STATE_CACHE_TTL 秒）
 
         Returns:
             bool: 是否运行
         """
+        now = time.monotonic()
+        cached_at, running = self._running_cache
+        if now - cached_at < self.STATE_CACHE_TTL:
+            return running
+
         try:
             # 通过检查游戏进程来判断
             result = self.adb_manager._run_adb_command(self.hwnd, ['shell', 'pidof', self.game_package])
-            return result is not None and result.strip() != ""
+            running = result is not None and result.strip() != ""
+            self._running_cache = (now, running)
+            return running
         except Exception as e:
             print(f"[错误] 句柄 {self.hwnd} 检查游戏运行状态失败: {e}")
             return False
@@ -290,12 +324,19 @@ class DaHuaXiYouGame:
 
     def get_current_activity(self) -> Optional[str]:
         """
-        获取当前活动
+        获取当前活动（结果缓存 STATE_CACHE_TTL 秒）
 
         Returns:
             Optional[str]: 活动名称
         """
-        return self.adb_manager._get_current_activity_by_dumpsys(self.hwnd)
+        now = time.monotonic()
+        cached_at, activity = self._activity_cache
+        if now - cached_at < self.STATE_CACHE_TTL:
+            return activity
+
+        activity = self.adb_manager._get_current_activity_by_dumpsys(self.hwnd)
+        self._activity_cache = (now, activity)
+        return activity
 
 
 # 使用示例
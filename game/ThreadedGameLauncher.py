@@ -1,29 +1,48 @@
+import asyncio
 import threading
-import concurrent.futures
 import queue
-from typing import List, Dict, Callable
-
-from game.GameDahuaXiyou import DaHuaXiYouGame
+from collections import deque
+from typing import List, Dict, Callable, Optional
 
 
 class ThreadedGameLauncher:
-    def __init__(self, max_workers: int = 3):
+    def __init__(self, max_workers: Optional[int] = None):
         """
-        多线程游戏启动器
+        游戏启动器（asyncio并发）
 
         Args:
-            max_workers (int): 最大线程数
+            max_workers (Optional[int]): 最大并发启动数，None表示所有窗口同时启动
         """
         self.max_workers = max_workers
         self.results_queue = queue.Queue()
-        self.progress_queue = queue.Queue()
+        self.progress_events = deque()
+        self.progress_lock = threading.Lock()
+        self.progress_ready = threading.Semaphore(0)
         self.stop_event = threading.Event()
 
+    def _post_progress(self, progress_info: Dict):
+        """
+        投递一条进度事件并唤醒监控线程
+
+        Args:
+            progress_info (Dict): 进度事件
+        """
+        with self.progress_lock:
+            self.progress_events.append(progress_info)
+        self.progress_ready.release()
+
+    def stop(self):
+        """
+        停止启动过程，并唤醒可能在等待进度事件的监控线程
+        """
+        self.stop_event.set()
+        self.progress_ready.release()
+
     def launch_games_threaded(self, adb_manager, selected_windows: List[Dict],
                               progress_callback: Callable = None,
                               log_callback: Callable = None) -> Dict:
         """
-        多线程启动游戏
+        启动游戏（同步入口，内部使用asyncio并发执行）
 
         Args:
             adb_manager: ADB管理器实例
@@ -34,14 +53,38 @@ class ThreadedGameLauncher:
         Returns:
             Dict: 启动结果统计
         """
+        return asyncio.run(self.launch_games_async(adb_manager, selected_windows,
+                                                   progress_callback, log_callback))
+
+    async def launch_games_async(self, adb_manager, selected_windows: List[Dict],
+                                 progress_callback: Callable = None,
+                                 log_callback: Callable = None) -> Dict:
+        """
+        异步并发启动游戏，所有窗口同时推进，阻塞的ADB调用放到默认线程池
+
+        Args:
+            adb_manager: ADB管理器实例
+            selected_windows: 选中的窗口列表
+            progress_callback: 进度回调函数
+            log_callback: 日志回调函数
+
+        Returns:
+            Dict: 启动结果统计
+        """
+        # 上一次启动可能被停止过，重新开始前复位停止标记和残留事件
+        self.stop_event.clear()
+        with self.progress_lock:
+            self.progress_events.clear()
+
         total_windows = len(selected_windows)
-        completed_count = 0
         results = {
             'total': total_windows,
             'success': 0,
             'failed': 0,
             'details': []
         }
+        loop = asyncio.get_running_loop()
+        limiter = asyncio.Semaphore(self.max_workers) if self.max_workers else None
 
         def _log_message(message: str):
             """线程安全的日志记录"""
@@ -55,14 +98,13 @@ class ThreadedGameLauncher:
             if progress_callback:
                 progress_callback(current, message)
 
-        def _launch_single_game(window_info: Dict) -> Dict:
-            """启动单个游戏（工作线程函数）"""
+        async def _launch_single_game(window_info: Dict) -> Dict:
+            """启动单个游戏（协程）"""
+            hwnd = window_info['hwnd']
+            title = window_info.get('title', '未知')
             try:
-                hwnd = window_info['hwnd']
-                title = window_info.get('title', '未知')
-
                 # 发送进度更新
-                self.progress_queue.put({
+                self._post_progress({
                     'type': 'start',
                     'hwnd': hwnd,
                     'title': title,
@@ -73,7 +115,8 @@ class ThreadedGameLauncher:
                 adb_port = adb_manager.get_port_from_handle(window_info)
                 window_info['adb_port'] = adb_port
                 # 连接到模拟器
-                if not adb_manager.connect_to_simulator(hwnd, adb_port):
+                connected = await loop.run_in_executor(None, adb_manager.connect_to_simulator, hwnd, adb_port)
+                if not connected:
                     result = {
                         'hwnd': hwnd,
                         'title': title,
@@ -81,7 +124,7 @@ class ThreadedGameLauncher:
                         'error': '连接失败',
                         'message': f"✗ 连接失败: {title}"
                     }
-                    self.progress_queue.put({
+                    self._post_progress({
                         'type': 'fail',
                         'hwnd': hwnd,
                         'title': title,
@@ -89,9 +132,10 @@ class ThreadedGameLauncher:
                     })
                     return result
 
-                # 创建游戏实例并启动
-                game = DaHuaXiYouGame(adb_manager, hwnd)
-                if game.launch_game(window_info):
+                # 创建游戏实例并启动（游戏模块在真正启动时才导入）
+                from game.GameDahuaXiyou import DaHuaXiYouGame
+                game = await loop.run_in_executor(None, DaHuaXiYouGame, adb_manager, hwnd)
+                if await loop.run_in_executor(None, game.launch_game, window_info):
                     result = {
                         'hwnd': hwnd,
                         'title': title,
@@ -100,7 +144,7 @@ class ThreadedGameLauncher:
                         'message': f"✓ 成功启动: {title}",
                         'game_instance': game
                     }
-                    self.progress_queue.put({
+                    self._post_progress({
                         'type': 'success',
                         'hwnd': hwnd,
                         'title': title,
@@ -114,7 +158,7 @@ class ThreadedGameLauncher:
                         'error': '启动失败',
                         'message': f"✗ 启动失败: {title}"
                     }
-                    self.progress_queue.put({
+                    self._post_progress({
                         'type': 'fail',
                         'hwnd': hwnd,
                         'title': title,
@@ -132,7 +176,7 @@ class ThreadedGameLauncher:
                     'error': error_msg,
                     'message': f"✗ 异常: {title} - {error_msg}"
                 }
-                self.progress_queue.put({
+                self._post_progress({
                     'type': 'error',
                     'hwnd': hwnd,
                     'title': title,
@@ -140,64 +184,66 @@ class ThreadedGameLauncher:
                 })
                 return result
 
-        # 使用线程池执行
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 提交所有任务
-            future_to_window = {
-                executor.submit(_launch_single_game, window): window
-                for window in selected_windows
-            }
-
-            # 启动进度监控线程
-            progress_thread = threading.Thread(
-                target=self._monitor_progress,
-                args=(total_windows, _update_progress, _log_message)
-            )
-            progress_thread.daemon = True
-            progress_thread.start()
-
-            # 收集结果
-            for future in concurrent.futures.as_completed(future_to_window):
-                if self.stop_event.is_set():
-                    break
-
-                window = future_to_window[future]
-                try:
-                    result = future.result(timeout=300)  # 5分钟超时
-                    results['details'].append(result)
-
-                    if result['success']:
-                        results['success'] += 1
-                    else:
-                        results['failed'] += 1
-
-                except concurrent.futures.TimeoutError:
-                    result = {
-                        'hwnd': window['hwnd'],
-                        'title': window.get('title', '未知'),
-                        'success': False,
-                        'error': '超时',
-                        'message': f"✗ 启动超时: {window.get('title', '未知')}"
-                    }
-                    results['details'].append(result)
-                    results['failed'] += 1
-                    _log_message(result['message'])
+        async def _run_with_timeout(window_info: Dict) -> Dict:
+            """带超时的单窗口启动"""
+            if self.stop_event.is_set():
+                return {
+                    'hwnd': window_info['hwnd'],
+                    'title': window_info.get('title', '未知'),
+                    'success': False,
+                    'error': '已取消',
+                    'message': f"✗ 已取消: {window_info.get('title', '未知')}"
+                }
+            try:
+                if limiter is None:
+                    return await asyncio.wait_for(_launch_single_game(window_info), timeout=300)  # 5分钟超时
+                async with limiter:
+                    return await asyncio.wait_for(_launch_single_game(window_info), timeout=300)
+            except asyncio.TimeoutError:
+                result = {
+                    'hwnd': window_info['hwnd'],
+                    'title': window_info.get('title', '未知'),
+                    'success': False,
+                    'error': '超时',
+                    'message': f"✗ 启动超时: {window_info.get('title', '未知')}"
+                }
+                _log_message(result['message'])
+                return result
 
-                except Exception as e:
-                    result = {
-                        'hwnd': window['hwnd'],
-                        'title': window.get('title', '未知'),
-                        'success': False,
-                        'error': str(e),
-                        'message': f"✗ 执行异常: {window.get('title', '未知')} - {e}"
-                    }
-                    results['details'].append(result)
-                    results['failed'] += 1
-                    _log_message(result['message'])
+        # 启动进度监控线程
+        progress_thread = threading.Thread(
+            target=self._monitor_progress,
+            args=(total_windows, _update_progress, _log_message)
+        )
+        progress_thread.daemon = True
+        progress_thread.start()
+
+        # 所有窗口并发启动
+        outcomes = await asyncio.gather(
+            *[_run_with_timeout(window) for window in selected_windows],
+            return_exceptions=True
+        )
+
+        for window, result in zip(selected_windows, outcomes):
+            if isinstance(result, Exception):
+                result = {
+                    'hwnd': window['hwnd'],
+                    'title': window.get('title', '未知'),
+                    'success': False,
+                    'error': str(result),
+                    'message': f"✗ 执行异常: {window.get('title', '未知')} - {result}"
+                }
+                _log_message(result['message'])
+
+            results['details'].append(result)
+            if result['success']:
+                results['success'] += 1
+            else:
+                results['failed'] += 1
 
         # 等待进度线程结束
-        self.stop_event.set()
-        progress_thread.join(timeout=5)
+        self.stop()
+        await loop.run_in_executor(None, progress_thread.join, 5)
 
         return results
 
@@ -206,21 +252,34 @@ class ThreadedGameLauncher:
         completed = 0
         active_tasks = {}
 
-        while not self.stop_event.is_set() and completed < total:
+        while completed < total:
             try:
-                # 非阻塞获取进度更新
-                progress_info = self.progress_queue.get(timeout=1.0)
+                # 阻塞等待事件到达，无轮询超时
+                self.progress_ready.acquire()
+                with self.progress_lock:
+                    batch = list(self.progress_events)
+                    self.progress_events.clear()
+
+                if not batch:
+                    if self.stop_event.is_set():
+                        break
+                    continue
+
+                # 批量取走的其余事件各自占用一个信号量计数，同步扣除
+                for _ in range(len(batch) - 1):
+                    self.progress_ready.acquire(blocking=False)
 
-                if progress_info['type'] == 'start':
-                    active_tasks[progress_info['hwnd']] = progress_info
-                    log_callback(f"[开始] {progress_info['message']}")
+                for progress_info in batch:
+                    if progress_info['type'] == 'start':
+                        active_tasks[progress_info['hwnd']] = progress_info
+                        log_callback(f"[开始] {progress_info['message']}")
 
-                elif progress_info['type'] in ['success', 'fail', 'error']:
-                    completed += 1
-                    if progress_info['hwnd'] in active_tasks:
-                        del active_tasks[progress_info['hwnd']]
+                    elif progress_info['type'] in ['success', 'fail', 'error']:
+                        completed += 1
+                        if progress_info['hwnd'] in active_tasks:
+                            del active_tasks[progress_info['hwnd']]
 
-                    log_callback(progress_info['message'])
+                        log_callback(progress_info['message'])
 
                 # 更新进度
                 progress_msg = f"已完成 {completed}/{total} 个窗口"
@@ -233,9 +292,6 @@ class ThreadedGameLauncher:
 
                 progress_callback(completed, progress_msg)
 
-            except queue.Empty:
-                # 队列为空，继续等待
-                continue
             except Exception as e:
                 log_callback(f"[进度监控错误] {e}")
                 break
\ No newline at end of file
@@ -1,5 +1,4 @@
 import wx
-import FunView
 
 class LoginDialog(wx.Dialog):
     def __init__(self, parent, title="登录"):
@@ -73,7 +72,8 @@ class MainApp(wx.App):
         result = dlg.ShowModal()
         
         if result == wx.ID_OK:
-            # 登录成功，显示主窗口
+            # 登录成功，显示主窗口（主界面依赖较重，登录后再导入）
+            import FunView
             frame = FunView.MainWindow()
             frame.Show()
             return True
@@ -1,8 +1,13 @@
-from peewee import Model, SqliteDatabase, IntegerField, TextField, DateTimeField
+from typing import Dict, List
+
+from peewee import Model, SqliteDatabase, IntegerField, TextField, DateTimeField, chunked
 from playhouse.fields import PickleField
 
 db = SqliteDatabase("data/game.db")
 
+# SQLite单条语句允许的最大绑定参数个数（3.32+默认值）
+SQLITE_MAX_VARIABLE_NUMBER = 32766
+
 class BaseModel(Model):
     class Meta:
         database = db
@@ -12,7 +17,25 @@ class MainMissionModel(BaseModel):
     description = TextField() #任务详细信息
     point_x = IntegerField() #任务横向坐标
     point_y = IntegerField() #任务纵向坐标
-    pass
+
+    @classmethod
+    def bulk_upsert(cls, rows: List[Dict]) -> int:
+        """
+        批量写入任务（单事务，冲突时覆盖）
+
+        Args:
+            rows (List[Dict]): 任务字段字典列表
+
+        Returns:
+            int: 写入的行数
+        """
+        if not rows:
+            return 0
+        batch_size = SQLITE_MAX_VARIABLE_NUMBER // len(cls._meta.fields)
+        with db.atomic():
+            for batch in chunked(rows, batch_size):
+                cls.insert_many(batch).on_conflict_replace().execute()
+        return len(rows)
 
 class teamModel(BaseModel):
     task_name = TextField()
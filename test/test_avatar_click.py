@@ -1,15 +1,25 @@
 # test/test_avatar_click.py
 import asyncio
+import ctypes
 import unittest
 import os
+import re
 import sys
+import traceback
+from operator import countOf
 from pathlib import Path
-from unittest.mock import Mock, patch, AsyncMock
+from time import perf_counter
+from types import MappingProxyType
+from ctypes import wintypes
 import logging
 
+import numpy as np
+from PIL import ImageGrab
+
 # 添加项目根目录到Python路径
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from util.WindowsAsyncAirtestHelper import EnhancedWindowsAsyncAirtestHelper
 
@@ -20,11 +30,155 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 坐标计算使用的基准分辨率及自己头像的基准坐标
+BASE_WIDTH, BASE_HEIGHT = 1280, 720
+BASE_AVATAR_X, BASE_AVATAR_Y = 1180, 150
+
+# 画面稳定检测：采样间隔（约60Hz）及每像素平均SAD阈值
+STABLE_POLL_INTERVAL = 0.016
+STABLE_SAD_PER_PIXEL = 2
+
+# 根据图片中的窗口标题设置关键词
+WINDOW_KEYWORDS = (
+    "大话西游手游",
+    "自由交易服[蟠桃园]-百里砚冰",
+    "百里砚冰",
+    "决战比武场",
+)
+# 所有关键词合并成一个正则，一次扫描即可完成匹配
+KEYWORDS_RE = re.compile("|".join(map(re.escape, WINDOW_KEYWORDS)))
+
+# 测试数据：不同头像类型和偏移（只读，防止用例之间互相修改）
+TEST_CASES = (
+    MappingProxyType({
+        "name": "自己头像_基准位置",
+        "avatar_type": "self",
+        "offset_x": 0,
+        "offset_y": 0,
+        "expected_region": "右上角"
+    }),
+    MappingProxyType({
+        "name": "自己头像_向右偏移",
+        "avatar_type": "self",
+        "offset_x": 20,  # 向右偏移
+        "offset_y": 0,
+        "expected_region": "右上角右侧"
+    }),
+    MappingProxyType({
+        "name": "自己头像_向下偏移",
+        "avatar_type": "self",
+        "offset_x": 0,
+        "offset_y": 20,  # 向下偏移
+        "expected_region": "右上角下方"
+    }),
+    MappingProxyType({
+        "name": "自己头像_向左上偏移",
+        "avatar_type": "self",
+        "offset_x": -20,  # 向左偏移
+        "offset_y": -10,  # 向上偏移
+        "expected_region": "左上侧"
+    }),
+)
+
+class _POINT(ctypes.Structure):
+    """Win32 POINT结构，用于读取/恢复鼠标位置"""
+    _fields_ = [("x", wintypes.LONG), ("y", wintypes.LONG)]
 
-class TestAvatarClick(unittest.TestCase):
+
+def _game_window_exists(keyword: str) -> bool:
     """
-    测试click_avatar_by_relative_position_async方法
-    基于图片中的游戏界面测试
+    直接用Win32 API快速探测是否存在标题包含关键词的可见窗口
+
+    Args:
+        keyword (str): 标题关键词
+
+    Returns:
+        bool: 是否存在匹配窗口
+    """
+    user32 = ctypes.windll.user32
+    found = []
+
+    @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    def _enum_proc(hwnd, _lparam):
+        if not user32.IsWindowVisible(hwnd):
+            return True
+        length = user32.GetWindowTextLengthW(hwnd)
+        if not length:
+            return True
+        buffer = ctypes.create_unicode_buffer(length + 1)
+        user32.GetWindowTextW(hwnd, buffer, length + 1)
+        if keyword in buffer.value:
+            found.append(hwnd)
+            return False  # 找到即停止枚举
+        return True
+
+    user32.EnumWindows(_enum_proc, 0)
+    return bool(found)
+
+
+async def _wait_until_stable(helper, max_ms: int = 500, patch_size: int = 64) -> bool:
+    """
+    以约60Hz截取窗口中心小块区域，相邻两帧SAD足够小即认为画面已稳定
+
+    Args:
+        helper: 已连接窗口的助手实例
+        max_ms (int): 最长等待时间（毫秒）
+        patch_size (int): 中心采样块边长
+
+    Returns:
+        bool: 是否在超时前检测到画面稳定
+    """
+    info = helper.window_info or {}
+    if not info.get('width') or not info.get('height'):
+        await asyncio.sleep(max_ms / 1000)
+        return False
+
+    half = patch_size // 2
+    cx = info['left'] + info['width'] // 2
+    cy = info['top'] + info['height'] // 2
+    bbox = (cx - half, cy - half, cx + half, cy + half)
+    threshold = STABLE_SAD_PER_PIXEL * patch_size * patch_size * 3
+
+    prev = None
+    deadline = perf_counter() + max_ms / 1000
+    while perf_counter() < deadline:
+        cur = np.asarray(ImageGrab.grab(bbox=bbox), dtype=np.int16)
+        if prev is not None and np.sum(np.abs(cur - prev)) < threshold:
+            return True
+        prev = cur
+        await asyncio.sleep(STABLE_POLL_INTERVAL)
+    return False
+
+
+class _FakeHelper:
+    """轻量级的助手替身，用于Mock测试"""
+
+    # 模拟窗口信息
+    window_info = {
+        'title': '大话西游手游 (自由交易服[蟠桃园]-百里砚冰[130386860])',
+        'width': 834,
+        'height': 699
+    }
+
+    async def smart_connect_async(self, *args, **kwargs):
+        return True
+
+    async def get_screen_size_async(self):
+        return (834, 699)
+
+    async def click_avatar_by_relative_position_async(self, **kwargs):
+        return True
+
+    async def take_screenshot_async(self, filename=None):
+        return Path("mock_screenshot.png")
+
+    async def close(self):
+        return None
+
+
+class TestAvatarClick(unittest.IsolatedAsyncioTestCase):
+    """
+    不依赖真实窗口的测试：Mock点击与坐标计算
     """
 
     def setUp(self):
@@ -33,49 +187,138 @@ class TestAvatarClick(unittest.TestCase):
         print("测试开始: click_avatar_by_relative_position_async")
         print("=" * 60)
 
-        # 保存原始截图目录
-        self.original_screenshots_dir = None
-        self.test_output_dir = Path("test_output")
-        self.test_output_dir.mkdir(exist_ok=True)
-
     def tearDown(self):
         """测试后清理"""
         print("\n" + "=" * 60)
         print("测试结束")
         print("=" * 60)
 
-    async def _async_test_avatar_click(self):
-        """异步测试方法"""
+    async def test_avatar_click_mocked(self):
+        """使用Mock的测试方法"""
+        print("\n测试Mock版本...")
+
+        # 创建Mock实例
+        mock_helper = _FakeHelper()
+
+        # 执行测试
+        connected = await mock_helper.smart_connect_async(["大话西游"])
+        self.assertTrue(connected, "Mock连接应该成功")
+
+        width, height = await mock_helper.get_screen_size_async()
+        self.assertEqual(width, 834, "宽度应该是834")
+        self.assertEqual(height, 699, "高度应该是699")
+
+        # 测试点击
+        success = await mock_helper.click_avatar_by_relative_position_async(
+            avatar_type="self",
+            offset_x=0,
+            offset_y=0
+        )
+        self.assertTrue(success, "Mock点击应该成功")
+
+        print("✅ Mock测试通过")
+
+    async def test_coordinate_calculation(self):
+        """测试坐标计算逻辑"""
+        print("\n测试坐标计算逻辑...")
+
+        # 模拟不同的分辨率
+        test_resolutions = [
+            (834, 699, "图片中的分辨率"),
+            (1280, 720, "标准720P"),
+            (1920, 1080, "标准1080P"),
+            (2560, 1440, "2K分辨率"),
+        ]
+
+        # 一次性计算所有分辨率的缩放比例和实际坐标
+        res = np.array([(w, h) for w, h, _ in test_resolutions], dtype=np.int32)
+        scale = res / np.array([BASE_WIDTH, BASE_HEIGHT])
+        coords = (np.array([BASE_AVATAR_X, BASE_AVATAR_Y]) * scale).astype(np.int32)
+
+        for (width, height, desc), (scale_x, scale_y), (actual_x, actual_y) in zip(test_resolutions, scale, coords):
+            print(f"\n测试分辨率: {width}x{height} ({desc})")
+            print(f"  基准坐标: ({BASE_AVATAR_X}, {BASE_AVATAR_Y})")
+            print(f"  缩放比例: {scale_x:.2f}x{scale_y:.2f}")
+            print(f"  计算坐标: ({actual_x}, {actual_y})")
+
+        # 验证坐标在屏幕范围内
+        self.assertTrue(np.all(coords >= 0), f"坐标应该>=0: {coords.tolist()}")
+        self.assertTrue(np.all(coords[:, 0] < res[:, 0]), f"X坐标应该小于宽度: {coords[:, 0].tolist()}")
+        self.assertTrue(np.all(coords[:, 1] < res[:, 1]), f"Y坐标应该小于高度: {coords[:, 1].tolist()}")
+
+        print(f"  ✅ 坐标验证通过")
+
+
+class TestAvatarClickRealWindow(unittest.IsolatedAsyncioTestCase):
+    """
+    测试click_avatar_by_relative_position_async方法
+    基于图片中的游戏界面测试，需要真实的游戏窗口
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """创建并连接所有测试共用的助手实例，只连接一次"""
         print("创建EnhancedWindowsAsyncAirtestHelper实例...")
-        helper = EnhancedWindowsAsyncAirtestHelper(
+        cls._class_loop = asyncio.new_event_loop()
+        cls._shared_helper = EnhancedWindowsAsyncAirtestHelper(
             window_keyword="大话西游",
             background_mode=False,  # 测试时用前台模式便于观察
             max_workers=3
         )
+        cls._shared_connected = cls._class_loop.run_until_complete(
+            cls._shared_helper.robust_connect_async(
+                keywords=WINDOW_KEYWORDS,
+                max_retries=2,
+                retry_delay=1.0,
+                matcher=KEYWORDS_RE
+            )
+        )
 
+    @classmethod
+    def tearDownClass(cls):
+        """关闭共用的助手实例"""
         try:
-            # 1. 连接到游戏窗口
-            print("步骤1: 连接到游戏窗口...")
-            # 根据图片中的窗口标题设置关键词
-            window_keywords = [
-                "大话西游手游",
-                "自由交易服[蟠桃园]-百里砚冰",
-                "百里砚冰",
-                "决战比武场"
-            ]
+            cls._class_loop.run_until_complete(cls._shared_helper.close())
+        finally:
+            cls._class_loop.close()
 
-            connected = await helper.robust_connect_async(
-                keywords=window_keywords,
-                max_retries=2,
-                retry_delay=1.0
-            )
+    async def asyncSetUp(self):
+        """每个测试复用类级别的助手实例"""
+        self.helper = self._shared_helper
+
+    def setUp(self):
+        """测试前准备"""
+        print("\n" + "=" * 60)
+        print("测试开始: click_avatar_by_relative_position_async")
+        print("=" * 60)
 
-            self.assertTrue(connected, "应该成功连接到游戏窗口")
+        # 保存原始截图目录
+        self.original_screenshots_dir = None
+        # 使用绝对路径，截图工具会直接使用而不再拼接到其截图目录下
+        self.test_output_dir = Path(project_root) / "test_output"
+        self.test_output_dir.mkdir(exist_ok=True)
+
+    def tearDown(self):
+        """测试后清理"""
+        print("\n" + "=" * 60)
+        print("测试结束")
+        print("=" * 60)
+
+    async def test_avatar_click(self):
+        """头像点击测试"""
+        helper = self.helper
+
+        try:
+            # 1. 连接到游戏窗口（已在setUpClass中完成）
+            print("步骤1: 连接到游戏窗口...")
+            self.assertTrue(self._shared_connected, "应该成功连接到游戏窗口")
             print(f"✅ 窗口连接成功: {helper.window_info['title'] if helper.window_info else 'Unknown'}")
 
             # 2. 获取窗口信息
             print("步骤2: 获取窗口信息...")
-            width, height = await helper.get_screen_size_async()
+            # 连接后只查询一次窗口尺寸，后续复用
+            self._cached_size = await helper.get_screen_size_async()
+            width, height = self._cached_size
             print(f"窗口分辨率: {width}x{height}")
 
             # 检查分辨率是否匹配图片中的834x699
@@ -85,86 +328,81 @@ class TestAvatarClick(unittest.TestCase):
             # 3. 测试不同头像点击
             print("\n步骤3: 测试头像点击功能...")
 
-            # 测试数据：不同头像类型和偏移
-            test_cases = [
-                {
-                    "name": "自己头像_基准位置",
-                    "avatar_type": "self",
-                    "offset_x": 0,
-                    "offset_y": 0,
-                    "expected_region": "右上角"
-                },
-                {
-                    "name": "自己头像_向右偏移",
-                    "avatar_type": "self",
-                    "offset_x": 20,  # 向右偏移
-                    "offset_y": 0,
-                    "expected_region": "右上角右侧"
-                },
-                {
-                    "name": "自己头像_向下偏移",
-                    "avatar_type": "self",
-                    "offset_x": 0,
-                    "offset_y": 20,  # 向下偏移
-                    "expected_region": "右上角下方"
-                },
-                {
-                    "name": "自己头像_向左上偏移",
-                    "avatar_type": "self",
-                    "offset_x": -20,  # 向左偏移
-                    "offset_y": -10,  # 向上偏移
-                    "expected_region": "左上侧"
-                }
+            # 预先生成每个用例的截图路径
+            screenshot_paths = [
+                (self.test_output_dir / f"before_click_{test_case['name']}.png",
+                 self.test_output_dir / f"after_click_{test_case['name']}.png")
+                for test_case in TEST_CASES
             ]
 
-            test_results = []
-
-            for i, test_case in enumerate(test_cases):
-                print(f"\n测试用例 {i + 1}: {test_case['name']}")
-                print(f"  头像类型: {test_case['avatar_type']}")
-                print(f"  偏移量: x={test_case['offset_x']}, y={test_case['offset_y']}")
-                print(f"  预期区域: {test_case['expected_region']}")
+            # 点击前截图全部提前发出，与点击并行进行
+            before_tasks = [
+                asyncio.create_task(helper.take_screenshot_async(before_path))
+                for before_path, _ in screenshot_paths
+            ]
+            # 只对真正的点击串行化，保持点击顺序
+            click_lock = asyncio.Semaphore(1)
+            after_tasks = []
+            # 用例执行期间只缓存日志，全部完成后一次性输出
+            log_lines = []
 
-                # 点击前截图
-                before_screenshot = await helper.take_screenshot_async(
-                    f"before_click_{test_case['name']}.png"
-                )
-                print(f"  点击前截图: {before_screenshot}")
+            async def run_case(i, test_case, before_task, after_path):
+                """执行单个测试用例：截图 -> 点击 -> 截图"""
+                before_screenshot = await before_task
 
                 # 执行点击
-                start_time = asyncio.get_event_loop().time()
-                success = await helper.click_avatar_by_relative_position_async(
-                    avatar_type=test_case['avatar_type'],
-                    offset_x=test_case['offset_x'],
-                    offset_y=test_case['offset_y'],
-                    region_expand=20
-                )
-                elapsed_time = asyncio.get_event_loop().time() - start_time
-
-                # 点击后截图
-                after_screenshot = await helper.take_screenshot_async(
-                    f"after_click_{test_case['name']}.png"
-                )
-                print(f"  点击后截图: {after_screenshot}")
-                print(f"  点击结果: {'✅ 成功' if success else '❌ 失败'}")
-                print(f"  耗时: {elapsed_time:.2f}秒")
-
-                # 等待一下，观察效果
-                await asyncio.sleep(0.5)
-
-                test_results.append({
+                async with click_lock:
+                    start_time = perf_counter()
+                    success = await helper.click_avatar_by_relative_position_async(
+                        avatar_type=test_case['avatar_type'],
+                        offset_x=test_case['offset_x'],
+                        offset_y=test_case['offset_y'],
+                        region_expand=20
+                    )
+                    elapsed_time = perf_counter() - start_time
+
+                # 点击后截图放到后台执行，不阻塞后续点击
+                after_tasks.append(asyncio.create_task(helper.take_screenshot_async(after_path)))
+                await asyncio.sleep(0)
+
+                log_lines.extend((
+                    f"\n测试用例 {i + 1}: {test_case['name']}",
+                    f"  头像类型: {test_case['avatar_type']}",
+                    f"  偏移量: x={test_case['offset_x']}, y={test_case['offset_y']}",
+                    f"  预期区域: {test_case['expected_region']}",
+                    f"  点击前截图: {before_screenshot}",
+                    f"  点击结果: {'✅ 成功' if success else '❌ 失败'}",
+                    f"  耗时: {elapsed_time:.2f}秒",
+                ))
+
+                return {
                     "name": test_case['name'],
                     "success": success,
                     "time": elapsed_time
-                })
+                }
+
+            test_results = await asyncio.gather(*[
+                run_case(i, test_case, before_task, after_path)
+                for i, (test_case, before_task, (_, after_path))
+                in enumerate(zip(TEST_CASES, before_tasks, screenshot_paths))
+            ])
+
+            # 统一收集点击后截图
+            after_screenshots = await asyncio.gather(*after_tasks)
+            log_lines.extend(f"点击后截图: {after_screenshot}" for after_screenshot in after_screenshots)
+            sys.stdout.write("\n".join(log_lines) + "\n")
+
+            # 等待画面稳定，观察效果
+            await _wait_until_stable(helper)
 
             # 4. 分析测试结果
             print("\n" + "=" * 60)
             print("测试结果分析:")
             print("=" * 60)
 
-            success_count = sum(1 for r in test_results if r['success'])
-            total_count = len(test_results)
+            flags = [r['success'] for r in test_results]
+            success_count = countOf(flags, True)
+            total_count = len(flags)
 
             print(f"总测试用例: {total_count}")
             print(f"成功用例: {success_count}")
@@ -183,11 +421,15 @@ class TestAvatarClick(unittest.TestCase):
 
             # 测试无效头像类型
             print("测试无效头像类型...")
-            with self.assertRaises(Exception, msg="无效头像类型应该抛出异常"):
-                await helper.click_avatar_by_relative_position_async(
-                    avatar_type="invalid_type",
-                    offset_x=0,
-                    offset_y=0
+            # 限时0.5秒，校验过慢时直接以超时失败，不会卡住测试
+            async with asyncio.timeout(0.5):
+                self.assertFalse(
+                    await helper.click_avatar_by_relative_position_async(
+                        avatar_type="invalid_type",
+                        offset_x=0,
+                        offset_y=0
+                    ),
+                    "无效头像类型应该返回False"
                 )
 
             # 测试超大偏移量（应该被自动调整）
@@ -203,104 +445,10 @@ class TestAvatarClick(unittest.TestCase):
 
         except Exception as e:
             print(f"❌ 测试过程中发生错误: {e}")
-            import traceback
             traceback.print_exc()
             raise
-        finally:
-            await helper.close()
-
-    def test_avatar_click_sync(self):
-        """同步包装器，用于unittest"""
-        asyncio.run(self._async_test_avatar_click())
-
-    @patch('util.WindowsAsyncAirtestHelper.EnhancedWindowsAsyncAirtestHelper')
-    async def test_avatar_click_mocked(self, MockHelper):
-        """使用Mock的测试方法"""
-        print("\n测试Mock版本...")
-
-        # 创建Mock实例
-        mock_helper = AsyncMock()
-
-        # 设置Mock返回值
-        mock_helper.smart_connect_async.return_value = True
-        mock_helper.get_screen_size_async.return_value = (834, 699)
-        mock_helper.click_avatar_by_relative_position_async.return_value = True
-        mock_helper.take_screenshot_async.return_value = Path("mock_screenshot.png")
-        mock_helper.close.return_value = None
-
-        # 模拟窗口信息
-        mock_helper.window_info = {
-            'title': '大话西游手游 (自由交易服[蟠桃园]-百里砚冰[130386860])',
-            'width': 834,
-            'height': 699
-        }
 
-        # 执行测试
-        connected = await mock_helper.smart_connect_async(["大话西游"])
-        self.assertTrue(connected, "Mock连接应该成功")
-
-        width, height = await mock_helper.get_screen_size_async()
-        self.assertEqual(width, 834, "宽度应该是834")
-        self.assertEqual(height, 699, "高度应该是699")
-
-        # 测试点击
-        success = await mock_helper.click_avatar_by_relative_position_async(
-            avatar_type="self",
-            offset_x=0,
-            offset_y=0
-        )
-        self.assertTrue(success, "Mock点击应该成功")
-
-        print("✅ Mock测试通过")
-
-    def test_avatar_click_mocked_sync(self):
-        """同步版本的Mock测试"""
-        asyncio.run(self.test_avatar_click_mocked())
-
-    async def _test_coordinate_calculation(self):
-        """测试坐标计算逻辑"""
-        print("\n测试坐标计算逻辑...")
-
-        # 模拟不同的分辨率
-        test_resolutions = [
-            (834, 699, "图片中的分辨率"),
-            (1280, 720, "标准720P"),
-            (1920, 1080, "标准1080P"),
-            (2560, 1440, "2K分辨率"),
-        ]
-
-        base_width, base_height = 1280, 720
-        base_x, base_y = 1180, 150  # 自己头像的基准坐标
-
-        for width, height, desc in test_resolutions:
-            print(f"\n测试分辨率: {width}x{height} ({desc})")
-
-            # 计算缩放比例
-            scale_x = width / base_width
-            scale_y = height / base_height
-
-            # 计算实际坐标
-            actual_x = int(base_x * scale_x)
-            actual_y = int(base_y * scale_y)
-
-            print(f"  基准坐标: ({base_x}, {base_y})")
-            print(f"  缩放比例: {scale_x:.2f}x{scale_y:.2f}")
-            print(f"  计算坐标: ({actual_x}, {actual_y})")
-
-            # 验证坐标在屏幕范围内
-            self.assertGreaterEqual(actual_x, 0, f"X坐标({actual_x})应该>=0")
-            self.assertLess(actual_x, width, f"X坐标({actual_x})应该<{width}")
-            self.assertGreaterEqual(actual_y, 0, f"Y坐标({actual_y})应该>=0")
-            self.assertLess(actual_y, height, f"Y坐标({actual_y})应该<{height}")
-
-            print(f"  ✅ 坐标验证通过")
-
-    def test_coordinate_calculation_sync(self):
-        """同步版本的坐标计算测试"""
-        asyncio.run(self._test_coordinate_calculation())
-
-
-class TestAvatarClickIntegration(unittest.TestCase):
+class TestAvatarClickIntegration(unittest.IsolatedAsyncioTestCase):
     """
     集成测试类 - 测试与实际游戏窗口的交互
     """
@@ -315,6 +463,10 @@ class TestAvatarClickIntegration(unittest.TestCase):
         print("开始实际游戏交互测试")
         print("=" * 60)
 
+        # 游戏未运行时直接跳过，避免走完整的连接重试流程
+        if not _game_window_exists("大话西游"):
+            self.skipTest("未找到游戏窗口")
+
         helper = EnhancedWindowsAsyncAirtestHelper()
 
         try:
@@ -329,9 +481,9 @@ class TestAvatarClickIntegration(unittest.TestCase):
             print("✅ 已连接到游戏窗口")
 
             # 获取当前鼠标位置
-            import pyautogui
-            original_pos = pyautogui.position()
-            print(f"原始鼠标位置: {original_pos}")
+            original_pos = _POINT()
+            ctypes.windll.user32.GetCursorPos(ctypes.byref(original_pos))
+            print(f"原始鼠标位置: ({original_pos.x}, {original_pos.y})")
 
             # 测试点击
             test_points = [
@@ -370,8 +522,8 @@ class TestAvatarClickIntegration(unittest.TestCase):
                 await asyncio.sleep(1.0)  # 等待游戏响应
 
             # 恢复鼠标位置
-            pyautogui.moveTo(original_pos.x, original_pos.y)
-            print(f"鼠标已恢复到原始位置: {original_pos}")
+            ctypes.windll.user32.SetCursorPos(original_pos.x, original_pos.y)
+            print(f"鼠标已恢复到原始位置: ({original_pos.x}, {original_pos.y})")
 
         finally:
             await helper.close()
@@ -383,10 +535,6 @@ class TestAvatarClickIntegration(unittest.TestCase):
                 status = "✅" if result["success"] else "❌"
                 print(f"  {status} {result['name']}")
 
-    def test_real_game_interaction_sync(self):
-        """同步版本的实际游戏交互测试"""
-        asyncio.run(self.test_real_game_interaction())
-
 
 # 运行测试的辅助函数
 def run_all_tests():
@@ -394,7 +542,11 @@ def run_all_tests():
     print("运行头像点击测试套件...")
 
     # 创建测试套件
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestAvatarClick)
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite([
+        loader.loadTestsFromTestCase(TestAvatarClick),
+        loader.loadTestsFromTestCase(TestAvatarClickRealWindow),
+    ])
 
     # 运行测试
     runner = unittest.TextTestRunner(verbosity=2)
@@ -408,7 +560,9 @@ def run_single_test(test_method_name):
     print(f"运行单个测试: {test_method_name}")
 
     suite = unittest.TestSuite()
-    suite.addTest(TestAvatarClick(test_method_name))
+    # 真实窗口的测试单独成类，只有它会创建并连接助手
+    test_class = TestAvatarClick if hasattr(TestAvatarClick, test_method_name) else TestAvatarClickRealWindow
+    suite.addTest(test_class(test_method_name))
 
     runner = unittest.TextTestRunner(verbosity=2)
     return runner.run(suite)
@@ -456,7 +610,6 @@ async def quick_test():
 
     except Exception as e:
         print(f"❌ 测试出错: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -484,7 +637,7 @@ if __name__ == "__main__":
 
     elif args.mode == "mock":
         suite = unittest.TestSuite()
-        suite.addTest(TestAvatarClick("test_avatar_click_mocked_sync"))
+        suite.addTest(TestAvatarClick("test_avatar_click_mocked"))
         runner = unittest.TextTestRunner(verbosity=2)
         result = runner.run(suite)
         exit(0 if result.wasSuccessful() else 1)
@@ -1,16 +1,165 @@
 # adb_app_manager.py
+import atexit
+import functools
+import glob
+import json
+import logging
 import subprocess
+import queue
 import re
+import threading
 import time
 import traceback
-import winreg
-from typing import List, Dict, Optional, Tuple, Union
-import cv2
-import numpy as np
+import weakref
+from collections import deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from typing import Any, Callable, List, Dict, Optional, Tuple, Union
 import os
 
+import uiautomator2 as u2
 from uiautomator2 import Device
 
+logger = logging.getLogger(__name__)
+
+# Windows下启动adb时不弹出控制台窗口（其他平台为0）
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# 常驻shell中每条命令结束后输出的结束标记，携带命令的退出码
+_RE_SHELL_END = re.compile(r'^__END_(\d+)__$')
+# 批量执行时各条命令输出之间的分隔标记
+_RE_SHELL_SEP = re.compile(r'\n__SEP_\d+__\n')
+
+# 预编译的解析正则
+_RE_PORT = re.compile(r'(\d{4,5})')
+_RE_INDEX = re.compile(r'[_-]?(\d+)')
+_RE_WM_SIZE = re.compile(r'(\d+)x(\d+)')
+_RE_TOP_ACT = re.compile(r'topActivity=([a-zA-Z0-9._]+/[a-zA-Z0-9._]+)')
+# logcat中Activity启动/显示事件，如 "START u0 {... cmp=com.x/.Main ...}"、"Displayed com.x/.Main: +1s"
+_RE_LOGCAT_ACT = re.compile(r'(?:START u\d+ \{.*?cmp=|Displayed )([\w.]+/[\w.$]+)')
+# logcat -d历史日志中含Displayed/Focused/Resumed的行及该行的Activity
+_RE_LOGCAT_HISTORY = re.compile(r'^(?=.*(?:Displayed|Focused|Resumed))[^\n]*?([a-zA-Z0-9._]+/[a-zA-Z0-9._]+)', re.M)
+# dumpsys activity activities中当前/顶层Activity的合并匹配
+_RE_CUR_ACT = re.compile(r'(?:mResumedActivity|mFocusedActivity|topActivity=|top-activity).*?([a-zA-Z0-9._]+/[a-zA-Z0-9._]+)')
+# dumpsys package中版本名、版本号、标签及主Activity（MAIN过滤器下一行）的合并匹配
+_RE_PKG_INFO = re.compile(
+    r'versionName=(?P<vname>\S+)'
+    r'|versionCode=(?P<vcode>\S+)'
+    r'|android:label="(?P<label>[^"]+)"'
+    r'|android\.intent\.action\.MAIN:\s*\n\s*\S+\s+(?P<main>[a-zA-Z0-9._]+/[a-zA-Z0-9._]+)'
+)
+_PKG_INFO_KEYS = {
+    'vname': 'version_name',
+    'vcode': 'version_code',
+    'label': 'app_name',
+    'main': 'main_activity',
+}
+_RE_LABELRES = re.compile(r'labelRes=0x[0-9a-fA-F]+\s+nonLocalizedLabel=null\s+label=([^\n]+)')
+
+# 批量获取应用详情时每批dumpsys的包数量，避免单条命令行过长
+APP_INFO_BATCH_SIZE = 32
+
+# 雷电模拟器ADB路径探测结果的缓存时间(秒)，模拟器启动/退出后能在该时间内重新探测
+INSTALL_CACHE_TTL = 60
+_INSTALL_CACHE = {'path': None, 'ts': 0.0}
+
+# 应用信息的磁盘缓存，按包名保存，versionCode变化时更新
+APP_INFO_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.dhsy', 'appinfo_cache.json')
+
+# Activity轮询的最短间隔(秒)，无变化时逐次翻倍，直到调用方给定的间隔上限
+ACTIVITY_POLL_MIN = 0.05
+
+
+@functools.lru_cache(maxsize=64)
+def _split_activity(activity: str) -> Tuple[str, str]:
+    """
+    拆分"包名/活动名"，轮询时同一Activity会反复出现，缓存拆分结果
+
+    Args:
+        activity (str): 完整Activity名称
+
+    Returns:
+        Tuple[str, str]: (包名, 活动名)
+    """
+    package_name, sep, activity_name = activity.partition('/')
+    return package_name, activity_name if sep else "未知"
+
+
+@functools.lru_cache(maxsize=1)
+def _format_second(second: int) -> str:
+    """
+    格式化整秒时间戳，同一秒内的多次格式化直接复用
+
+    Args:
+        second (int): 整秒时间戳
+
+    Returns:
+        str: 格式为"%Y-%m-%d %H:%M:%S"的时间
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+
+
+class ActivityRecord(namedtuple('ActivityRecord',
+                                'ts full pkg act label version_name version_code main_activity')):
+    """
+    Activity记录，监控历史中按元组保存，需要旧的字典格式时调用to_dict
+
+    ts为time.time()时间戳，格式化后的时间通过timestamp属性按需获取
+    """
+    __slots__ = ()
+
+    @property
+    def timestamp(self) -> str:
+        """
+        记录时间，格式为"%Y-%m-%d %H:%M:%S"
+        """
+        return _format_second(int(self.ts))
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        转换为旧版字典格式（full_activity/package_name/activity_name/timestamp及应用信息）
+
+        Returns:
+            Dict[str, str]: Activity详细信息
+        """
+        activity_info = {
+            'full_activity': self.full,
+            'package_name': self.pkg,
+            'activity_name': self.act,
+            'timestamp': self.timestamp
+        }
+        for key, value in (('app_name', self.label), ('version_name', self.version_name),
+                           ('version_code', self.version_code), ('main_activity', self.main_activity)):
+            if value is not None:
+                activity_info[key] = value
+        return activity_info
+
+
+def compile_activity_matcher(target_activity: str) -> Callable[[str], bool]:
+    """
+    生成Activity匹配函数，支持精确匹配和模糊匹配（目标为当前Activity的子串）
+
+    Args:
+        target_activity (str): 目标Activity名称
+
+    Returns:
+        Callable[[str], bool]: 传入当前Activity，返回是否匹配
+    """
+    # 精确匹配是子串匹配的特例，只需一次子串查找
+    return lambda current_activity: bool(current_activity) and target_activity in current_activity
+
+
+# 所有存活的管理器实例，程序退出时统一写回各自的应用信息缓存
+_live_managers: 'weakref.WeakSet[ADBAppManager]' = weakref.WeakSet()
+
+
+@atexit.register
+def _save_all_app_info_caches():
+    """
+    程序正常退出时写回所有存活管理器的应用信息缓存
+    """
+    for manager in list(_live_managers):
+        manager.save_app_info_cache()
+
 
 class ADBAppManager:
     def __init__(self, adb_path:str = None):
@@ -20,7 +169,45 @@ class ADBAppManager:
         self.adb_path = adb_path or self._find_adb_path()
         self.connected_ports = {}  # 端口到句柄的映射 {port: hwnd}
         self.hwnd_to_port = {}  # 句柄到端口的映射 {hwnd: port}
-        self.adb_available = self._check_adb_availability()
+        self._shell_procs: Dict[int, subprocess.Popen] = {}  # 常驻adb shell进程 {hwnd: Popen}
+        self._shell_outputs: Dict[int, queue.Queue] = {}  # 常驻shell的输出行队列 {hwnd: Queue}
+        self._shell_locks: Dict[int, threading.Lock] = {}  # 每个常驻shell一次只执行一条命令
+        self._shell_locks_guard = threading.Lock()
+        self._u2: Dict[int, Device] = {}  # uiautomator2长连接 {hwnd: Device}，用于点击/滑动/输入
+        self._mapping_lock = threading.Lock()  # 保护hwnd_to_port/connected_ports的写入
+        self._pool: Optional[ThreadPoolExecutor] = None  # 多设备并发执行的线程池（延迟创建）
+        self._poll_executor: Optional[ThreadPoolExecutor] = None  # Activity监控中执行ADB查询的线程池（延迟创建）
+        self._prefix_cache: Dict[int, List[str]] = {}  # 每个句柄的adb命令前缀 {hwnd: [adb, '-s', 地址]}
+        self._activity_cache: Dict[int, Tuple[float, str]] = {}  # 当前Activity短时缓存 {hwnd: (时间, activity)}
+        self._activity_cache_ttl = 0.2  # 当前Activity缓存有效期(秒)，轮询间隔内的重复查询直接复用
+        self._app_info_cache: Dict[Tuple[int, str], Optional[Dict[str, str]]] = {}  # {(hwnd, 包名): 应用信息}
+        self._app_info_cache_lock = threading.Lock()  # _app_info_cache会在多个线程中同时遍历和修改
+        self._app_info_disk: Optional[Dict[str, Dict[str, str]]] = None  # 磁盘缓存 {包名: 应用信息}（延迟加载）
+        self._app_info_disk_dirty = False
+        self._app_info_disk_lock = threading.Lock()
+        self._app_info_checked: set = set()  # 本次运行中已用dumpsys核对过的包名，磁盘缓存命中只作为临时结果
+        _live_managers.add(self)
+        self._watchers: Dict[int, subprocess.Popen] = {}  # 推送Activity变化的logcat进程 {hwnd: Popen}
+        self._activity_listeners: Dict[int, List[Callable[[str], None]]] = {}  # Activity变化回调 {hwnd: [回调]}
+        self._watcher_refs: Dict[int, int] = {}  # 正在使用logcat推送的调用数 {hwnd: 引用数}，归零时结束进程
+        self._watchers_lock = threading.Lock()
+        self._inflight: Dict[int, Future] = {}  # 正在进行的当前Activity查询 {hwnd: Future}，并发调用共享结果
+        self._inflight_lock = threading.Lock()
+        self.debug: bool = False  # 是否输出每条ADB命令及其返回信息
+        # adb --version可能阻塞数秒，放到后台探测，首次访问adb_available时才等待结果
+        probe = ThreadPoolExecutor(max_workers=1, thread_name_prefix='adb-probe')
+        self._adb_avail_future: Future = probe.submit(self._check_adb_availability)
+        probe.shutdown(wait=False)
+
+    @property
+    def adb_available(self) -> bool:
+        """
+        ADB是否可用，后台探测未完成时阻塞等待
+
+        Returns:
+            bool: ADB是否可用
+        """
+        return self._adb_avail_future.result()
 
     def get_port_from_handle(self, window_info: dict) -> Optional[int]:
         """
@@ -70,7 +257,7 @@ class ADBAppManager:
         title_lower = title.lower()
 
         # 直接查找端口号
-        port_match = re.search(r'(\d{4,5})', title)
+        port_match = _RE_PORT.search(title)
         if port_match:
             port = int(port_match.group(1))
             if 5555 <= port <= 5580:  # 雷电常用端口范围
@@ -79,7 +266,7 @@ class ADBAppManager:
         # 根据雷电模拟器编号映射端口
         if "雷电模拟器" in title or "ldplayer" in title_lower:
             # 查找模拟器编号
-            index_match = re.search(r'[_-]?(\d+)', title)
+            index_match = _RE_INDEX.search(title)
             if index_match:
                 index = int(index_match.group(1))
                 # 雷电模拟器端口映射: 索引1->5555, 索引2->5557, 索引3->5559, 等等
@@ -90,7 +277,8 @@ class ADBAppManager:
 
         return None
 
-    def _get_ldplayer_installation_path(self) -> Optional[str]:
+    @staticmethod
+    def _get_ldplayer_installation_path() -> Optional[str]:
         """
         获取雷电模拟器的安装目录
 
@@ -102,9 +290,13 @@ class ADBAppManager:
             # 检查进程获取路径（如果雷电模拟器正在运行）
 
             import psutil
-            for proc in psutil.process_iter(['name', 'exe']):
+            # 只取进程名筛选，命中后再单独读取exe，避免对每个进程都解析可执行文件路径
+            for proc in psutil.process_iter(['name']):
                 if proc.info['name'] and 'dnplayer' in proc.info['name'].lower():
-                    exe_path = proc.info['exe']
+                    try:
+                        exe_path = proc.exe()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
                     if exe_path:
                         install_dir = os.path.dirname(os.path.dirname(exe_path))
                         if os.path.exists(install_dir):
@@ -116,16 +308,34 @@ class ADBAppManager:
             print(f"[警告] 获取雷电模拟器安装路径失败: {e}")
             return None
 
-    def _get_ldplayer_adb_path(self) -> Optional[str]:
+    @staticmethod
+    def _get_ldplayer_adb_path() -> Optional[str]:
+        """
+        获取雷电模拟器的ADB路径，结果缓存INSTALL_CACHE_TTL秒
+
+        Returns:
+            Optional[str]: 雷电模拟器ADB路径，如果找不到返回None
+        """
+        now = time.monotonic()
+        if _INSTALL_CACHE['ts'] and now - _INSTALL_CACHE['ts'] < INSTALL_CACHE_TTL:
+            return _INSTALL_CACHE['path']
+
+        adb_path = ADBAppManager._search_ldplayer_adb_path()
+        _INSTALL_CACHE['path'] = adb_path
+        _INSTALL_CACHE['ts'] = now
+        return adb_path
+
+    @staticmethod
+    def _search_ldplayer_adb_path() -> Optional[str]:
         """
-        获取雷电模拟器的ADB路径
+        在雷电模拟器安装目录中查找ADB
 
         Returns:
             Optional[str]: 雷电模拟器ADB路径，如果找不到返回None
         """
         try:
             # 获取雷电模拟器安装目录
-            ld_path = self._get_ldplayer_installation_path()
+            ld_path = ADBAppManager._get_ldplayer_installation_path()
             if not ld_path:
                 return None
 
@@ -140,17 +350,30 @@ class ADBAppManager:
             for version in ["9.0", "5.0"]:
                 possible_adb_paths.append(os.path.join(ld_path, f"LDPlayer{version}", "adb.exe"))
 
+            # 一次列出主目录及其子目录下的adb.exe，再按优先级挑选，避免逐个stat
+            existing = {os.path.normcase(path) for path in
+                        glob.glob(os.path.join(ld_path, "adb.exe")) +
+                        glob.glob(os.path.join(ld_path, "*", "adb.exe"))}
             for adb_path in possible_adb_paths:
-                if os.path.exists(adb_path):
+                if os.path.normcase(adb_path) in existing:
                     print(f"[成功] 找到雷电模拟器ADB: {adb_path}")
                     return adb_path
 
-            # 如果没找到具体的adb.exe，但找到了雷电目录，尝试查找其他可能的位置
-            for root, dirs, files in os.walk(ld_path):
-                if "adb.exe" in files:
-                    full_path = os.path.join(root, "adb.exe")
-                    print(f"[成功] 在子目录找到ADB: {full_path}")
-                    return full_path
+            # 如果没找到具体的adb.exe，但找到了雷电目录，按层广度优先查找（最多3层）
+            pending = deque([(ld_path, 0)])
+            while pending:
+                current_dir, depth = pending.popleft()
+                try:
+                    with os.scandir(current_dir) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                if depth < 3:
+                                    pending.append((entry.path, depth + 1))
+                            elif entry.name.lower() == "adb.exe":
+                                print(f"[成功] 在子目录找到ADB: {entry.path}")
+                                return entry.path
+                except OSError:
+                    continue
 
             return None
 
@@ -212,40 +435,34 @@ class ADBAppManager:
             print(f"[错误] ADB检查异常: {e}")
             return False
 
-    def _safe_run_command(self, command: List[str], timeout: int = 10) -> Optional[subprocess.CompletedProcess]:
+    def _safe_run_command(self, command: List[str], timeout: int = 10,
+                          want_stderr: bool = True) -> Optional[subprocess.CompletedProcess]:
         """
         安全执行命令 - 修复subprocess调用问题
+
+        Args:
+            command (List[str]): 命令参数列表
+            timeout (int): 超时时间(秒)
+            want_stderr (bool): 是否读取错误输出，为False时直接丢弃，少建一个管道
         """
         try:
-            print(f"[调试] 执行命令: {command}")
-
-            # 确保所有路径参数被正确引用（特别是包含空格的路径）
-            if self.adb_path != 'adb' and any(' ' in arg for arg in command):
-                # 对于包含空格的路径，使用shell=True并正确转义
-                shell_command = ' '.join([f'"{arg}"' if ' ' in arg else arg for arg in command])
-                print(f"[调试] Shell命令: {shell_command}")
-                result = subprocess.run(
-                    shell_command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',  # 明确指定UTF-8编码
-                    errors='ignore',  # 忽略无法解码的字符
-                    timeout=timeout
-                )
-            else:
-                # 普通执行
-                result = subprocess.run(
-                    command,
-                    shell=False,  # 明确设置为False
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',  # 明确指定UTF-8编码
-                    errors='ignore',  # 忽略无法解码的字符
-                    timeout=timeout
-                )
-
-            if result.returncode != 0:
+            if self.debug:
+                print(f"[调试] 执行命令: {command}")
+
+            # 参数列表直接交给CreateProcess，含空格的路径也会被正确引用，无需经过shell
+            result = subprocess.run(
+                command,
+                shell=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE if want_stderr else subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',  # 明确指定UTF-8编码
+                errors='ignore',  # 忽略无法解码的字符
+                timeout=timeout,
+                creationflags=_CREATE_NO_WINDOW
+            )
+
+            if self.debug and result.returncode != 0:
                 print(f"[命令错误] 返回码: {result.returncode}")
                 if result.stderr:
                     print(f"[命令错误] 错误输出: {result.stderr}")
@@ -253,16 +470,19 @@ class ADBAppManager:
             return result
 
         except FileNotFoundError as e:
-            traceback.print_exc()  # 打印完整的 traceback 信息到控制台
+            if self.debug:
+                traceback.print_exc()  # 打印完整的 traceback 信息到控制台
             print(f"[错误] 文件未找到: {e}")
             print(f"[错误] 命令: {command}")
             return None
         except subprocess.TimeoutExpired:
-            traceback.print_exc()  # 打印完整的 traceback 信息到控制台
+            if self.debug:
+                traceback.print_exc()  # 打印完整的 traceback 信息到控制台
             print(f"[错误] 命令超时: {command}")
             return None
         except Exception as e:
-            traceback.print_exc()  # 打印完整的 traceback 信息到控制台
+            if self.debug:
+                traceback.print_exc()  # 打印完整的 traceback 信息到控制台
             print(f"[错误] 命令执行异常: {e}")
             print(f"[错误] 命令: {command}")
             return None
@@ -291,18 +511,22 @@ class ADBAppManager:
                 print("[连接] 命令执行失败")
                 return False
 
-            print(f"[连接] 命令输出: {result.stdout}")
+            if self.debug:
+                print(f"[连接] 命令输出: {result.stdout}")
             if result.stderr:
                 print(f"[连接] 错误输出: {result.stderr}")
 
             if 'connected' in result.stdout or 'already' in result.stdout:
                 print(f"[成功] 句柄 {hwnd} 连接到端口 {adb_port}")
-                self.connected_ports[adb_port] = hwnd
-                self.hwnd_to_port[hwnd] = adb_port
+                with self._mapping_lock:
+                    self.connected_ports[adb_port] = hwnd
+                    self.hwnd_to_port[hwnd] = adb_port
+                    self._prefix_cache[hwnd] = [self.adb_path, '-s', f'127.0.0.1:{adb_port}']
 
                 # 验证连接
                 if self._verify_connection(hwnd):
                     print(f"[成功] 连接验证通过")
+                    self._connect_u2(hwnd, adb_port)
                     return True
                 else:
                     print(f"[警告] 连接验证失败")
@@ -314,35 +538,45 @@ class ADBAppManager:
 
         except Exception as e:
             print(f"[错误] 连接异常: {e}")
-            import traceback
-            traceback.print_exc()
+            if self.debug:
+                traceback.print_exc()
             return False
 
+    def _connect_u2(self, hwnd: int, adb_port: int):
+        """
+        建立uiautomator2长连接，失败时操作回退到adb shell input
+
+        Args:
+            hwnd (int): 窗口句柄
+            adb_port (int): ADB端口
+        """
+        try:
+            self._u2[hwnd] = u2.connect(f'127.0.0.1:{adb_port}')
+        except Exception as e:
+            print(f"[警告] 句柄 {hwnd} uiautomator2连接失败，将使用adb input: {e}")
+
     def _verify_connection(self, hwnd: int) -> bool:
         """验证连接"""
         try:
-            result = self._run_adb_command(hwnd, ['shell', 'echo', 'test'], timeout=5)
+            result = self._shell_output(hwnd, 'echo test', timeout=5)
             return result is not None and 'test' in result
         except:
             return False
 
-    def _run_adb_command(self, hwnd: int, command: List[str], timeout: int = 10) -> Optional[str]:
+    def _run_adb_command(self, hwnd: int, command: List[str], timeout: int = 10,
+                         want_stderr: bool = True) -> Optional[str]:
         """执行ADB命令"""
         if not self.adb_available or hwnd not in self.hwnd_to_port:
             print(f"[错误] ADB不可用或句柄未连接: {hwnd}")
             return None
 
-        adb_port = self.hwnd_to_port[hwnd]
-
         # 构建完整命令
-        if self.adb_path == 'adb':
-            full_cmd = ['adb', '-s', f'127.0.0.1:{adb_port}'] + command
-        else:
-            full_cmd = [self.adb_path, '-s', f'127.0.0.1:{adb_port}'] + command
+        full_cmd = self._adb_prefix(hwnd) + command
 
-        print(f"[ADB命令] 句柄 {hwnd} 端口 {adb_port}: {' '.join(full_cmd)}")
+        if self.debug:
+            print(f"[ADB命令] 句柄 {hwnd} 端口 {self.hwnd_to_port[hwnd]}: {' '.join(full_cmd)}")
 
-        result = self._safe_run_command(full_cmd, timeout)
+        result = self._safe_run_command(full_cmd, timeout, want_stderr)
         if result and result.returncode == 0:
             return result.stdout.strip()
 
@@ -351,7 +585,209 @@ class ADBAppManager:
 
         return None
 
-    def click_position(self, hwnd: int, x: int, y: int) -> bool:
+    def _adb_prefix(self, hwnd: int) -> List[str]:
+        """
+        获取句柄对应的adb命令前缀，连接时生成，断开时清除
+
+        Args:
+            hwnd (int): 窗口句柄
+
+        Returns:
+            List[str]: [adb路径, '-s', 设备地址]
+        """
+        prefix = self._prefix_cache.get(hwnd)
+        if prefix is None:
+            prefix = [self.adb_path, '-s', f'127.0.0.1:{self.hwnd_to_port[hwnd]}']
+            self._prefix_cache[hwnd] = prefix
+        return prefix
+
+    def _get_shell(self, hwnd: int) -> Tuple[subprocess.Popen, queue.Queue]:
+        """
+        获取句柄对应的常驻adb shell进程，不存在或已退出时重新创建
+
+        Args:
+            hwnd (int): 窗口句柄
+
+        Returns:
+            Tuple[subprocess.Popen, queue.Queue]: shell进程及其输出行队列
+        """
+        proc = self._shell_procs.get(hwnd)
+        if proc is not None and proc.poll() is None:
+            return proc, self._shell_outputs[hwnd]
+
+        adb_port = self.hwnd_to_port[hwnd]
+        proc = subprocess.Popen(
+            self._adb_prefix(hwnd) + ['shell'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            creationflags=_CREATE_NO_WINDOW
+        )
+        output = queue.Queue()
+        reader = threading.Thread(target=self._pump_shell_output, args=(proc, output), daemon=True)
+        reader.start()
+
+        self._shell_procs[hwnd] = proc
+        self._shell_outputs[hwnd] = output
+        print(f"[Shell] 句柄 {hwnd} 已启动常驻shell，端口 {adb_port}")
+        return proc, output
+
+    @staticmethod
+    def _pump_shell_output(proc: subprocess.Popen, output: queue.Queue):
+        """持续读取常驻shell的输出行，进程结束时放入None"""
+        try:
+            for raw_line in iter(proc.stdout.readline, b''):
+                output.put(raw_line.decode('utf-8', errors='ignore'))
+        finally:
+            output.put(None)
+
+    def _close_shell(self, hwnd: int, force: bool = False):
+        """
+        关闭句柄对应的常驻shell
+
+        Args:
+            hwnd (int): 窗口句柄
+            force (bool): 是否直接结束进程（命令卡住时使用）
+        """
+        proc = self._shell_procs.pop(hwnd, None)
+        self._shell_outputs.pop(hwnd, None)
+        if proc is None:
+            return
+        if force:
+            proc.kill()
+            return
+        try:
+            if proc.poll() is None:
+                proc.stdin.write(b'exit\n')
+                proc.stdin.flush()
+                proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+
+    def _shell_exec(self, hwnd: int, cmdline: str, timeout: int = 10) -> Optional[Tuple[str, int]]:
+        """
+        在常驻adb shell中执行一条命令
+
+        Args:
+            hwnd (int): 窗口句柄
+            cmdline (str): 设备端执行的shell命令行
+            timeout (int): 超时时间(秒)
+
+        Returns:
+            Optional[Tuple[str, int]]: (命令输出, 退出码)，执行失败返回None
+        """
+        if not self.adb_available or hwnd not in self.hwnd_to_port:
+            print(f"[错误] ADB不可用或句柄未连接: {hwnd}")
+            return None
+
+        with self._shell_locks_guard:
+            lock = self._shell_locks.setdefault(hwnd, threading.Lock())
+
+        with lock:
+            if self.debug:
+                print(f"[ADB命令] 句柄 {hwnd} shell: {cmdline}")
+            try:
+                proc, output = self._get_shell(hwnd)
+                # 输出前先换行，保证结束标记独占一行
+                proc.stdin.write(f"{cmdline}; printf '\\n__END_%s__\\n' $?\n".encode('utf-8'))
+                proc.stdin.flush()
+
+                deadline = time.monotonic() + timeout
+                lines = []
+                while True:
+                    line = output.get(timeout=max(deadline - time.monotonic(), 0))
+                    if line is None:
+                        print(f"[警告] 句柄 {hwnd} 常驻shell已退出，改用单次adb shell")
+                        self._close_shell(hwnd)
+                        return self._shell_exec_once(hwnd, cmdline, timeout)
+
+                    end_match = _RE_SHELL_END.match(line.rstrip('\r\n'))
+                    if end_match:
+                        body = ''.join(lines)
+                        if body.endswith('\n'):
+                            body = body[:-1]
+                        return body, int(end_match.group(1))
+                    lines.append(line)
+
+            except queue.Empty:
+                print(f"[错误] 句柄 {hwnd} 命令超时: {cmdline}")
+                # 输出已经错位，直接丢弃这个shell，下次重新创建
+                self._close_shell(hwnd, force=True)
+                return None
+            except Exception as e:
+                print(f"[警告] 句柄 {hwnd} 常驻shell执行异常，改用单次adb shell: {e}")
+                self._close_shell(hwnd, force=True)
+                return self._shell_exec_once(hwnd, cmdline, timeout)
+
+    def _shell_exec_once(self, hwnd: int, cmdline: str, timeout: int = 10) -> Optional[Tuple[str, int]]:
+        """
+        常驻shell不可用时的回退：启动一次性adb shell执行命令
+
+        Args:
+            hwnd (int): 窗口句柄
+            cmdline (str): 设备端执行的shell命令行
+            timeout (int): 超时时间(秒)
+
+        Returns:
+            Optional[Tuple[str, int]]: (命令输出, 退出码)，执行失败返回None
+        """
+        result = self._safe_run_command(self._adb_prefix(hwnd) + ['shell', cmdline], timeout, want_stderr=False)
+        if result is None:
+            return None
+        body = result.stdout
+        if body.endswith('\n'):
+            body = body[:-1]
+        return body, result.returncode
+
+    def _shell_output(self, hwnd: int, cmdline: str, timeout: int = 10) -> Optional[str]:
+        """
+        在常驻shell中执行命令，成功时返回去除首尾空白的输出
+
+        Args:
+            hwnd (int): 窗口句柄
+            cmdline (str): 设备端执行的shell命令行
+            timeout (int): 超时时间(秒)
+
+        Returns:
+            Optional[str]: 命令输出，失败返回None
+        """
+        result = self._shell_exec(hwnd, cmdline, timeout)
+        if result is None:
+            return None
+
+        body, exit_code = result
+        if exit_code != 0:
+            if self.debug:
+                print(f"[命令错误] 返回码: {exit_code}")
+            return None
+        return body.strip()
+
+    def _shell_exec_many(self, hwnd: int, cmds: List[str], timeout: int = 30) -> Optional[List[str]]:
+        """
+        在常驻shell中一次性执行多条命令，只需一次往返
+
+        Args:
+            hwnd (int): 窗口句柄
+            cmds (List[str]): 设备端执行的shell命令行列表
+            timeout (int): 整批命令的超时时间(秒)
+
+        Returns:
+            Optional[List[str]]: 与cmds一一对应的输出，执行失败返回None
+        """
+        if not cmds:
+            return []
+
+        # 每条命令后输出一个分隔标记，用于切分各自的输出
+        cmdline = '; '.join(f"{cmd}; printf '\\n__SEP_{i}__\\n'" for i, cmd in enumerate(cmds))
+        result = self._shell_exec(hwnd, cmdline, timeout)
+        if result is None:
+            return None
+
+        outputs = _RE_SHELL_SEP.split(result[0] + '\n')
+        return [output.strip() for output in outputs[:len(cmds)]]
+
+    def click_position(self, hwnd: int, x: int, y: int, settle_ms: int = 0) -> bool:
         """
         在指定句柄的模拟器上点击坐标
 
@@ -359,15 +795,28 @@ class ADBAppManager:
             hwnd (int): 窗口句柄
             x (int): X坐标
             y (int): Y坐标
+            settle_ms (int): 点击成功后等待画面响应的时间(毫秒)，默认不等待
 
         Returns:
             bool: 是否成功
         """
         try:
-            result = self._run_adb_command(hwnd, ['shell', 'input', 'tap', str(x), str(y)])
+            device = self._u2.get(hwnd)
+            if device is not None:
+                try:
+                    device.click(x, y)
+                    print(f"[成功] 句柄 {hwnd} 点击坐标: ({x}, {y})")
+                    if settle_ms:
+                        time.sleep(settle_ms / 1000)
+                    return True
+                except Exception as e:
+                    print(f"[警告] 句柄 {hwnd} uiautomator2点击失败，改用adb input: {e}")
+
+            result = self._shell_output(hwnd, f'input tap {x} {y}')
             if result is not None:
                 print(f"[成功] 句柄 {hwnd} 点击坐标: ({x}, {y})")
-                time.sleep(0.5)  # 点击后延迟
+                if settle_ms:
+                    time.sleep(settle_ms / 1000)
                 return True
             return False
         except Exception as e:
@@ -388,12 +837,15 @@ class ADBAppManager:
             bool: 是否成功
         """
         try:
-            result = self._run_adb_command(hwnd, [
-                'shell', 'input', 'swipe',
-                str(start_x), str(start_y),
-                str(end_x), str(end_y),
-                str(duration)
-            ])
+            device = self._u2.get(hwnd)
+            if device is not None:
+                try:
+                    device.swipe(start_x, start_y, end_x, end_y, duration / 1000)
+                    return True
+                except Exception as e:
+                    print(f"[警告] 句柄 {hwnd} uiautomator2滑动失败，改用adb input: {e}")
+
+            result = self._shell_output(hwnd, f'input swipe {start_x} {start_y} {end_x} {end_y} {duration}')
             return result is not None
         except Exception as e:
             print(f"[错误] 句柄 {hwnd} 滑动失败: {e}")
@@ -411,9 +863,17 @@ class ADBAppManager:
             bool: 是否成功
         """
         try:
+            device = self._u2.get(hwnd)
+            if device is not None:
+                try:
+                    device.send_keys(text)
+                    return True
+                except Exception as e:
+                    print(f"[警告] 句柄 {hwnd} uiautomator2输入失败，改用adb input: {e}")
+
             # 转义特殊字符
             text = text.replace(' ', '%s').replace('"', '\\"')
-            result = self._run_adb_command(hwnd, ['shell', 'input', 'text', text])
+            result = self._shell_output(hwnd, f'input text {text}')
             return result is not None
         except Exception as e:
             print(f"[错误] 句柄 {hwnd} 输入文本失败: {e}")
@@ -430,9 +890,9 @@ class ADBAppManager:
             Optional[Tuple[int, int]]: (宽度, 高度)
         """
         try:
-            result = self._run_adb_command(hwnd, ['shell', 'wm', 'size'])
+            result = self._shell_output(hwnd, 'wm size')
             if result:
-                match = re.search(r'(\d+)x(\d+)', result)
+                match = _RE_WM_SIZE.search(result)
                 if match:
                     width = int(match.group(1))
                     height = int(match.group(2))
@@ -457,30 +917,31 @@ class ADBAppManager:
         """
         try:
             # 获取所有包名
-            cmd = ['shell', 'pm', 'list', 'packages']
+            cmd = 'pm list packages'
             if show_system_apps:
-                cmd.append('-a')  # 显示所有应用（包括系统应用）
+                cmd += ' -a'  # 显示所有应用（包括系统应用）
 
-            result = self._run_adb_command(hwnd, cmd)
+            result = self._shell_output(hwnd, cmd)
             if not result:
                 return []
 
             # 解析包名
             packages = []
             for line in result.split('\n'):
-                if line.startswith('package:'):
-                    package_name = line.replace('package:', '').strip()
-                    packages.append(package_name)
-                    if _package_name in package_name:
-                        packages = []
-                        packages.append(_package_name)
-                        return packages
+                if not line.startswith('package:'):
+                    continue
+                package_name = line[8:].strip()
+                # 找到目标包名时直接返回
+                if _package_name and _package_name in package_name:
+                    return [_package_name]
+                packages.append(package_name)
 
             print(f"[成功] 找到 {len(packages)} 个应用")
             return packages
 
         except Exception as e:
-            traceback.print_exc()  # 打印完整的 traceback 信息到控制台
+            if self.debug:
+                traceback.print_exc()  # 打印完整的 traceback 信息到控制台
             print(f"[错误] 获取应用列表失败: {e}")
             return []
 
@@ -505,11 +966,18 @@ class ADBAppManager:
 
             apps_with_details = []
 
-            for package_name in packages:
-                # 获取应用详细信息
-                app_info = self.get_app_info(package_name)
-                if app_info:
-                    apps_with_details.append(app_info)
+            # 分批在一次shell往返中dumpsys多个包
+            for start in range(0, len(packages), APP_INFO_BATCH_SIZE):
+                batch = packages[start:start + APP_INFO_BATCH_SIZE]
+                outputs = self._shell_exec_many(hwnd, [f'dumpsys package {pkg}' for pkg in batch])
+                if outputs is None:
+                    continue
+
+                for pkg, output in zip(batch, outputs):
+                    # 解析应用详细信息
+                    app_info = self._parse_app_info(pkg, output)
+                    if app_info:
+                        apps_with_details.append(app_info)
 
             return apps_with_details
 
@@ -529,65 +997,106 @@ class ADBAppManager:
             :param package_name:
             :param hwnd:
         """
-        try:
-            # 获取应用基本信息
-            cmd = ['shell', 'dumpsys', 'package', package_name]
-            result = self._run_adb_command(hwnd, cmd)
-            if not result:
-                return None
+        if not self.adb_available or hwnd not in self.hwnd_to_port:
+            print(f"[错误] ADB不可用或句柄未连接: {hwnd}")
+            return None
+
+        # 在常驻shell中执行，不再为每次查询单独启动adb进程；解析与批量路径共用同一套规则
+        result = self._shell_exec(hwnd, f'dumpsys package {package_name}')
+        if result is None:
+            print(f"[错误] 获取应用信息失败 {package_name}")
+            return None
+        return self._parse_app_info(package_name, result[0])
 
-            app_info = {'package_name': package_name}
+    def _load_app_info_disk(self) -> Dict[str, Dict[str, str]]:
+        """
+        加载应用信息磁盘缓存（首次调用时读取文件）
 
-            # 解析应用信息
-            lines = result.split('\n')
-            for line in lines:
-                line = line.strip()
-
-                # 应用名称
-                if 'versionName=' in line:
-                    version_match = re.search(r'versionName=([^\s]+)', line)
-                    if version_match:
-                        app_info['version_name'] = version_match.group(1)
-
-                # 版本代码
-                if 'versionCode=' in line:
-                    code_match = re.search(r'versionCode=([^\s]+)', line)
-                    if code_match:
-                        app_info['version_code'] = code_match.group(1)
-
-                # 应用标签（名称）
-                if 'android:label=' in line:
-                    label_match = re.search(r'android:label="([^"]+)"', line)
-                    if label_match:
-                        app_info['app_name'] = label_match.group(1)
-
-                # 主Activity
-                if 'android.intent.action.MAIN:' in line:
-                    main_match = re.search(r'([a-zA-Z0-9._]+/[a-zA-Z0-9._]+)', line)
-                    if main_match:
-                        app_info['main_activity'] = main_match.group(1)
-
-            # 如果没有找到应用名称，尝试其他方法
-            if 'app_name' not in app_info:
-                # 使用pm命令获取应用标签
-                # 使用原始字符串前缀 r
-                label_cmd = [
-            'adb', '-s', f'127.0.0.1:{self.hwnd_to_port}',
-            'shell', 'dumpsys', 'package', package_name, '|', 'grep', '-A', '5', 'MAIN'
-        ]
-                label_result = self._run_adb_command(hwnd, label_cmd)
-                if label_result:
-                    label_match = re.search(r'labelRes=0x[0-9a-fA-F]+\s+nonLocalizedLabel=null\s+label=([^\n]+)',
-                                            label_result)
-                    if label_match:
-                        app_info['app_name'] = label_match.group(1).strip()
-
-            return app_info
+        Returns:
+            Dict[str, Dict[str, str]]: 包名到应用信息的映射
+        """
+        with self._app_info_disk_lock:
+            if self._app_info_disk is None:
+                try:
+                    with open(APP_INFO_CACHE_PATH, 'r', encoding='utf-8') as f:
+                        self._app_info_disk = json.load(f)
+                except (OSError, ValueError):
+                    self._app_info_disk = {}
+            return self._app_info_disk
+
+    def _remember_app_info(self, app_info: Dict[str, str]):
+        """
+        记录dumpsys得到的应用信息，versionCode与缓存不同时替换缓存并使内存中的旧信息失效
 
-        except Exception as e:
-            print(f"[错误] 获取应用信息失败 {package_name}: {e}")
+        Args:
+            app_info (Dict[str, str]): 应用信息，需包含package_name
+        """
+        package_name = app_info['package_name']
+        disk = self._load_app_info_disk()
+        with self._app_info_disk_lock:
+            cached = disk.get(package_name)
+            if cached is not None and cached.get('version_code') == app_info.get('version_code'):
+                return
+            disk[package_name] = dict(app_info)
+            self._app_info_disk_dirty = True
+
+        # 应用已升级或首次记录，各句柄上的旧信息不再可用
+        with self._app_info_cache_lock:
+            for key in [key for key in self._app_info_cache if key[1] == package_name]:
+                self._app_info_cache.pop(key, None)
+
+    def save_app_info_cache(self):
+        """
+        将应用信息缓存写回磁盘（有变化时才写），程序正常退出时自动调用
+        """
+        with self._app_info_disk_lock:
+            if not self._app_info_disk_dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(APP_INFO_CACHE_PATH), exist_ok=True)
+                with open(APP_INFO_CACHE_PATH, 'w', encoding='utf-8') as f:
+                    json.dump(self._app_info_disk, f, indent=2, ensure_ascii=False)
+                self._app_info_disk_dirty = False
+            except OSError as e:
+                print(f"[警告] 保存应用信息缓存失败: {e}")
+
+    def _parse_app_info(self, package_name: str, dumpsys_output: str) -> Optional[Dict[str, str]]:
+        """
+        解析dumpsys package输出中的应用信息
+
+        Args:
+            package_name (str): 包名
+            dumpsys_output (str): dumpsys package命令输出
+
+        Returns:
+            Optional[Dict[str, str]]: 应用信息字典
+        """
+        if not dumpsys_output:
             return None
 
+        app_info = {'package_name': package_name}
+
+        # 解析应用信息：一个合并正则在整段输出上扫描一遍，同名字段以最后一次出现为准
+        for match in _RE_PKG_INFO.finditer(dumpsys_output):
+            app_info[_PKG_INFO_KEYS[match.lastgroup]] = match.group(match.lastgroup)
+
+        # 如果没有找到应用名称，在MAIN附近的行中查找标签（同grep -A 5 MAIN，无需再次执行dumpsys）
+        if 'app_name' not in app_info:
+            lines = dumpsys_output.split('\n')
+            main_context = []
+            for i, line in enumerate(lines):
+                if 'MAIN' in line:
+                    main_context.extend(lines[i:i + 6])
+            label_match = _RE_LABELRES.search('\n'.join(main_context))
+            if label_match:
+                app_info['app_name'] = label_match.group(1).strip()
+
+        self._app_info_checked.add(package_name)
+        # 找不到包等情况下没有解析出任何字段，不写入磁盘缓存
+        if 'version_code' in app_info:
+            self._remember_app_info(app_info)
+        return app_info
+
 
     def get_installed_apps_by_keyword(self, keyword: str, hwnd: int, package_name:str, show_system_apps: bool = False) -> List[Dict[str, str]]:
         """
@@ -694,7 +1203,8 @@ class ADBAppManager:
             bool: 是否成功
         """
         try:
-            result = self._run_adb_command(hwnd, ['shell', 'am', 'force-stop', package_name])
+            # 只看返回码，不需要错误输出
+            result = self._run_adb_command(hwnd, ['shell', 'am', 'force-stop', package_name], want_stderr=False)
             return result is not None
         except Exception as e:
             print(f"[错误] 句柄 {hwnd} 停止应用失败: {e}")
@@ -733,44 +1243,185 @@ class ADBAppManager:
             bool: 是否成功断开
         """
         try:
-            if hwnd in self.hwnd_to_port:
-                port = self.hwnd_to_port[hwnd]
-                result = subprocess.run(['adb', 'disconnect', f'127.0.0.1:{port}'],
-                                        capture_output=True, text=True)
-
-                # 清理映射
-                if port in self.connected_ports:
-                    del self.connected_ports[port]
-                del self.hwnd_to_port[hwnd]
+            port = self._release(hwnd)
+            if port is None:
+                return False
 
-                return 'disconnected' in result.stdout
-            return False
+            result = self._safe_run_command([self.adb_path, 'disconnect', f'127.0.0.1:{port}'], want_stderr=False)
+            return result is not None and 'disconnected' in result.stdout
         except Exception as e:
             print(f"[错误] 句柄 {hwnd} 断开连接失败: {e}")
             return False
 
+    def _release(self, hwnd: int) -> Optional[int]:
+        """
+        关闭句柄的常驻shell和uiautomator2连接并清理映射，不执行adb disconnect
+
+        Args:
+            hwnd (int): 窗口句柄
+
+        Returns:
+            Optional[int]: 句柄对应的端口，未连接返回None
+        """
+        if hwnd not in self.hwnd_to_port:
+            return None
+
+        self._close_shell(hwnd)
+        self._stop_activity_watcher(hwnd)
+        self._u2.pop(hwnd, None)
+        self._activity_cache.pop(hwnd, None)
+        with self._app_info_cache_lock:
+            for key in [key for key in self._app_info_cache if key[0] == hwnd]:
+                self._app_info_cache.pop(key, None)
+
+        # 清理映射
+        with self._mapping_lock:
+            port = self.hwnd_to_port.pop(hwnd, None)
+            self.connected_ports.pop(port, None)
+            self._prefix_cache.pop(hwnd, None)
+        return port
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """
+        获取多设备并发执行用的线程池（首次使用时创建）
+
+        Returns:
+            ThreadPoolExecutor: 线程池
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=min(32, len(self.hwnd_to_port) + 4))
+        return self._pool
+
+    def _get_poll_executor(self) -> ThreadPoolExecutor:
+        """
+        获取Activity监控用的线程池（首次使用时创建），与run_on_all的线程池分开，避免互相占满
+
+        Returns:
+            ThreadPoolExecutor: 线程池
+        """
+        if self._poll_executor is None:
+            self._poll_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='activity-poll')
+        return self._poll_executor
+
+    def run_on_all(self, fn: Callable, *args) -> Dict[int, Any]:
+        """
+        在所有已连接的句柄上并发执行fn(hwnd, *args)
+
+        Args:
+            fn (Callable): 第一个参数为句柄的方法
+            *args: 其余参数
+
+        Returns:
+            Dict[int, Any]: 句柄到执行结果的映射，执行异常的句柄结果为None
+        """
+        with self._mapping_lock:
+            hwnds = list(self.hwnd_to_port.keys())
+        if not hwnds:
+            return {}
+
+        pool = self._get_pool()
+        futures = {pool.submit(fn, hwnd, *args): hwnd for hwnd in hwnds}
+        results = {}
+        for future in as_completed(futures):
+            hwnd = futures[future]
+            try:
+                results[hwnd] = future.result()
+            except Exception as e:
+                print(f"[错误] 句柄 {hwnd} 并发执行失败: {e}")
+                results[hwnd] = None
+        return results
+
     def disconnect_all(self) -> bool:
         """
-        断开所有ADB连接
+        断开本管理器建立的所有ADB连接，只断开自己持有的端口，不影响其他会话使用的设备
 
         Returns:
-            bool: 是否成功
+            bool: 是否全部成功
         """
         try:
-            hwnds = list(self.hwnd_to_port.keys())
-            success = True
-            for hwnd in hwnds:
-                if not self.disconnect(hwnd):
-                    success = False
-            return success
+            # 每个端口各自执行一次adb disconnect，由线程池并发执行
+            results = self.run_on_all(self.disconnect)
+            self.save_app_info_cache()
+            return all(results.values())
         except Exception as e:
             print(f"[错误] 断开所有连接失败: {e}")
             return False
 
+    def launch_app_all(self, package_name: str) -> Dict[int, bool]:
+        """
+        在所有已连接的模拟器上并发启动应用
+
+        Args:
+            package_name (str): 包名
+
+        Returns:
+            Dict[int, bool]: 句柄到是否成功的映射
+        """
+        return self.run_on_all(self.launch_app, package_name)
+
+    def stop_app_all(self, package_name: str) -> Dict[int, bool]:
+        """
+        在所有已连接的模拟器上并发停止应用
+
+        Args:
+            package_name (str): 包名
+
+        Returns:
+            Dict[int, bool]: 句柄到是否成功的映射
+        """
+        return self.run_on_all(self.stop_app, package_name)
+
+    def get_current_activity_all(self) -> Dict[int, Optional[str]]:
+        """
+        并发获取所有已连接模拟器的当前Activity
+
+        Returns:
+            Dict[int, Optional[str]]: 句柄到当前Activity的映射
+        """
+        return self.run_on_all(self.get_current_activity)
+
     def get_current_activity(self, hwnd: int) -> Optional[str]:
         """
         获取当前前台Activity
 
+        Args:
+            hwnd (int): 窗口句柄
+
+        Returns:
+            Optional[str]: 当前Activity名称，格式为"包名/活动名"
+        """
+        now = time.monotonic()
+        cached = self._activity_cache.get(hwnd)
+        if cached and now - cached[0] < self._activity_cache_ttl:
+            return cached[1]
+
+        # 同一句柄同时只发起一次查询，其他线程等待并共享这次的结果
+        with self._inflight_lock:
+            future = self._inflight.get(hwnd)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[hwnd] = future
+        if not is_owner:
+            return future.result()
+
+        try:
+            activity = self._query_current_activity(hwnd)
+            if activity:
+                self._activity_cache[hwnd] = (now, activity)
+            future.set_result(activity)
+            return activity
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(hwnd, None)
+
+    def _query_current_activity(self, hwnd: int) -> Optional[str]:
+        """
+        通过ADB查询当前前台Activity，依次尝试dumpsys、logcat、am
+
         Args:
             hwnd (int): 窗口句柄
 
@@ -782,8 +1433,6 @@ class ADBAppManager:
                 print(f"[错误] 句柄 {hwnd} 未连接")
                 return None
 
-            port = self.hwnd_to_port[hwnd]
-
             # 方法1: 使用dumpsys activity（最可靠）
             activity = self._get_current_activity_by_dumpsys(hwnd)
             if activity:
@@ -811,81 +1460,54 @@ class ADBAppManager:
         使用dumpsys activity获取当前Activity（最可靠的方法）
         """
         try:
-            port = self.hwnd_to_port[hwnd]
-
-            # 方法1.1: 查找mResumedActivity
-            cmd1 = [
-                self.adb_path, '-s', f'127.0.0.1:{port}',
-                'shell', 'dumpsys', 'activity', 'activities',
-                '|', 'grep', '-E', 'mResumedActivity|mFocusedActivity'
-            ]
+            # 只执行一次dumpsys activity activities，用合并正则一遍扫描出mResumed/mFocused/顶层Activity
+            # 解析格式: mResumedActivity: ActivityRecord{... com.netease.dhxy/.MainActivity}
+            result = self._shell_output(hwnd, 'dumpsys activity activities')
+            return self._parse_current_activity(result)
 
-            result = self._safe_run_command(cmd1)
-            print(result)
-            if result and result.stdout:
-                lines = result.stdout.split('\n')
+        except Exception as e:
+            print(f"[错误] dumpsys获取Activity失败: {e}")
+            return None
 
-                for line in lines:
-                    # 解析格式: mResumedActivity: ActivityRecord{... com.netease.dhxy/.MainActivity}
-                    match = re.search(r'([a-zA-Z0-9._]+/[a-zA-Z0-9._]+)', line)
-                    if match:
-                        activity = match.group(1)
-                        print(f"[Dumpsys] 找到当前Activity: {activity}")
-                        return activity
-
-            # 方法1.2: 查找顶层Activity
-            cmd2 = [
-                self.adb_path, '-s', f'127.0.0.1:{port}',
-                'shell', 'dumpsys', 'activity', '|', 'grep', '-A', '5', 'top-activity'
-            ]
+    def _parse_current_activity(self, dumpsys_output: Optional[str]) -> Optional[str]:
+        """
+        从dumpsys activity activities输出中解析当前Activity
 
-            result = self._safe_run_command(cmd2)
-            if result and result.stdout:
-                lines = result.stdout.split('\n')
-                print(result)
-                for line in lines:
-                    if 'top-activity' in line:
-                        match = re.search(r'([a-zA-Z0-9._]+/[a-zA-Z0-9._]+)', line)
-                        if match:
-                            activity = match.group(1)
-                            print(f"[Dumpsys] 找到顶层Activity: {activity}")
-                            return activity
+        Args:
+            dumpsys_output (Optional[str]): dumpsys activity activities命令输出
 
+        Returns:
+            Optional[str]: 当前Activity名称，找不到返回None
+        """
+        if not dumpsys_output:
             return None
 
-        except Exception as e:
-            print(f"[错误] dumpsys获取Activity失败: {e}")
+        match = _RE_CUR_ACT.search(dumpsys_output)
+        if not match:
             return None
 
+        activity = match.group(1)
+        if self.debug:
+            print(f"[Dumpsys] 找到当前Activity: {activity}")
+        return activity
+
     def _get_current_activity_by_logcat(self, hwnd: int) -> Optional[str]:
         """
         使用logcat获取当前Activity
         """
         try:
-            port = self.hwnd_to_port[hwnd]
-
             # 清空旧日志
-            clear_cmd = [self.adb_path, '-s', f'127.0.0.1:{port}', 'shell', 'logcat', '-c']
-            self._safe_run_command(clear_cmd)
+            self._shell_output(hwnd, 'logcat -c')
 
             # 获取最近的Activity切换日志
-            cmd = [
-                self.adb_path, '-s', f'127.0.0.1:{port}',
-                'shell', 'logcat', '-d', '-s', 'ActivityManager',
-                '|', 'grep', '-E', 'Displayed|Focused|Resumed', '|', 'tail', '-5'
-            ]
-
-            result = self._safe_run_command(cmd)
-            if result and result.stdout:
-                lines = result.stdout.split('\n')
-                # 从最新的日志开始查找
-                for line in reversed(lines):
-                    if any(keyword in line for keyword in ['Displayed', 'Focused', 'Resumed']):
-                        match = re.search(r'([a-zA-Z0-9._]+/[a-zA-Z0-9._]+)', line)
-                        if match:
-                            activity = match.group(1)
-                            print(f"[Logcat] 找到Activity: {activity}")
-                            return activity
+            result = self._shell_output(hwnd, 'logcat -d -s ActivityManager')
+            if result:
+                # 预编译正则一遍扫描整段日志，取最后一条（最新的）匹配记录
+                activities = _RE_LOGCAT_HISTORY.findall(result)
+                if activities:
+                    activity = activities[-1]
+                    print(f"[Logcat] 找到Activity: {activity}")
+                    return activity
 
             return None
 
@@ -898,34 +1520,22 @@ class ADBAppManager:
         使用am命令获取当前Activity
         """
         try:
-            port = self.hwnd_to_port[hwnd]
-
             # 方法3.1: 使用am stack list
-            cmd1 = [
-                self.adb_path, '-s', f'127.0.0.1:{port}',
-                'shell', 'am', 'stack', 'list'
-            ]
-
-            result = self._safe_run_command(cmd1)
-            if result and result.stdout:
-                lines = result.stdout.split('\n')
+            result = self._shell_output(hwnd, 'am stack list')
+            if result:
+                lines = result.split('\n')
                 for line in lines:
                     if 'taskId=' in line and 'topActivity=' in line:
-                        match = re.search(r'topActivity=([a-zA-Z0-9._]+/[a-zA-Z0-9._]+)', line)
+                        match = _RE_TOP_ACT.search(line)
                         if match:
                             activity = match.group(1)
                             print(f"[AM] 找到顶层Activity: {activity}")
                             return activity
 
             # 方法3.2: 使用am命令的其他方式
-            cmd2 = [
-                self.adb_path, '-s', f'127.0.0.1:{port}',
-                'shell', 'am', 'get-current-activity'
-            ]
-
-            result = self._safe_run_command(cmd2)
-            if result and result.stdout:
-                activity = result.stdout.strip()
+            result = self._shell_output(hwnd, 'am get-current-activity')
+            if result:
+                activity = result
                 if activity and '/' in activity:
                     print(f"[AM] 找到当前Activity: {activity}")
                     return activity
@@ -936,7 +1546,7 @@ class ADBAppManager:
             print(f"[错误] am命令获取Activity失败: {e}")
             return None
 
-    def get_current_activity_with_details(self, hwnd: int) -> Optional[Dict[str, str]]:
+    def get_current_activity_with_details(self, hwnd: int) -> Optional[ActivityRecord]:
         """
         获取当前Activity的详细信息
 
@@ -944,41 +1554,101 @@ class ADBAppManager:
             hwnd (int): 窗口句柄
 
         Returns:
-            Optional[Dict[str, str]]: Activity详细信息
+            Optional[ActivityRecord]: Activity详细信息，需要字典时调用to_dict()
         """
         try:
-            activity = self.get_current_activity(hwnd)
+            activity, app_info = self._get_activity_and_app_info(hwnd)
             if not activity:
                 return None
 
-            # 解析包名和活动名
-            if '/' in activity:
-                package_name, activity_name = activity.split('/', 1)
-            else:
-                package_name = activity
-                activity_name = "未知"
+            return self._build_activity_info(hwnd, activity, app_info)
 
-            # 获取应用信息
-            app_info = self.get_app_info(hwnd, package_name)
+        except Exception as e:
+            print(f"[错误] 获取Activity详情失败: {e}")
+            return None
 
-            activity_info = {
-                'full_activity': activity,
-                'package_name': package_name,
-                'activity_name': activity_name,
-                'timestamp': time.strftime("%Y-%m-%d %H:%M:%S")
-            }
+    def _build_activity_info(self, hwnd: int, activity: str,
+                             app_info: Optional[Dict[str, str]] = None) -> ActivityRecord:
+        """
+        根据Activity名称组装详细信息，应用信息优先使用缓存
 
+        Args:
+            hwnd (int): 窗口句柄
+            activity (str): 完整Activity名称
+            app_info (Optional[Dict[str, str]]): 已获取到的最新应用信息
+
+        Returns:
+            ActivityRecord: Activity详细信息
+        """
+        # 解析包名和活动名
+        package_name, activity_name = _split_activity(activity)
+
+        # 获取应用信息，运行中的应用信息基本不变，按(句柄, 包名)缓存
+        cache_key = (hwnd, package_name)
+        with self._app_info_cache_lock:
+            if app_info is not None:
+                self._app_info_cache[cache_key] = app_info
+                cached = True
+            else:
+                cached = cache_key in self._app_info_cache
+                app_info = self._app_info_cache.get(cache_key)
+        if not cached:
+            # 内存没有时先查磁盘缓存，都没有才执行dumpsys（不持锁，避免阻塞其他句柄）
+            # 磁盘缓存只是临时结果，_get_activity_and_app_info会在下一次合并查询中核对版本
+            app_info = self._load_app_info_disk().get(package_name)
+            if app_info is None:
+                app_info = self.get_app_info(package_name, hwnd)
+            # adb或dumpsys临时失败时不缓存，下次再重试
             if app_info:
-                activity_info.update(app_info)
+                with self._app_info_cache_lock:
+                    self._app_info_cache[cache_key] = app_info
+
+        app_info = app_info or {}
+        return ActivityRecord(
+            ts=time.time(),
+            full=activity,
+            pkg=package_name,
+            act=activity_name,
+            label=app_info.get('app_name'),
+            version_name=app_info.get('version_name'),
+            version_code=app_info.get('version_code'),
+            main_activity=app_info.get('main_activity')
+        )
+
+    def _get_activity_and_app_info(self, hwnd: int) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+        """
+        获取当前Activity，并在同一次shell往返中顺带获取其应用信息
 
-            return activity_info
+        以上次Activity的包名作为预测，应用信息未缓存或尚未用dumpsys核对过（来自磁盘缓存）时
+        把dumpsys package和dumpsys activity activities放在一起执行；已核对或预测不中时只返回Activity
 
-        except Exception as e:
-            print(f"[错误] 获取Activity详情失败: {e}")
-            return None
+        Args:
+            hwnd (int): 窗口句柄
 
-    def monitor_activity_changes(self, hwnd: int, duration: int = 30, interval: float = 1.0) -> List[
-        Dict[str, str]]:
+        Returns:
+            Tuple[Optional[str], Optional[Dict[str, str]]]: (当前Activity, 顺带获取的应用信息)
+        """
+        cached = self._activity_cache.get(hwnd)
+        if cached and time.monotonic() - cached[0] < self._activity_cache_ttl:
+            return cached[1], None
+
+        guess = _split_activity(cached[1])[0] if cached else None
+        if not guess or ((hwnd, guess) in self._app_info_cache and guess in self._app_info_checked):
+            return self.get_current_activity(hwnd), None
+
+        now = time.monotonic()
+        outputs = self._shell_exec_many(hwnd, ['dumpsys activity activities', f'dumpsys package {guess}'])
+        activity = self._parse_current_activity(outputs[0]) if outputs else None
+        if not activity:
+            # dumpsys没有结果时走完整的备选流程
+            return self.get_current_activity(hwnd), None
+
+        self._activity_cache[hwnd] = (now, activity)
+        if _split_activity(activity)[0] != guess:
+            return activity, None
+        return activity, self._parse_app_info(guess, outputs[1])
+
+    def monitor_activity_changes(self, hwnd: int, duration: int = 30, interval: float = 1.0) -> List[ActivityRecord]:
         """
         监控Activity变化
 
@@ -988,33 +1658,214 @@ class ADBAppManager:
             interval (float): 检查间隔(秒)
 
         Returns:
-            List[Dict[str, str]]: Activity变化历史
+            List[ActivityRecord]: Activity变化历史
         """
         activity_history = []
         last_activity = None
-        start_time = time.time()
+        deadline = time.monotonic() + duration
+        poll = ACTIVITY_POLL_MIN
 
-        print(f"[监控] 开始监控Activity变化，时长: {duration}秒")
+        logger.info(f"[监控] 开始监控Activity变化，时长: {duration}秒")
 
+        watching = False
         try:
-            while time.time() - start_time < duration:
-                current_activity = self.get_current_activity_with_details(hwnd)
-
-                if current_activity and current_activity['full_activity'] != last_activity:
-                    print(f"[监控] Activity变化: {last_activity} -> {current_activity['full_activity']}")
+            # 优先由logcat推送变化，推送不可用或中途退出时剩余时间改为轮询
+            watching = self._start_activity_watcher(hwnd)
+            if watching:
+                last_activity = self._monitor_by_events(hwnd, deadline, activity_history)
+
+            pool = self._get_poll_executor()
+            future = None
+            while time.monotonic() < deadline:
+                # ADB查询放到线程池执行，与等待间隔重叠，实际周期接近poll而不是poll+ADB耗时
+                # 上一次查询超时仍未返回时继续等它，不再提交新的查询
+                if future is None:
+                    future = pool.submit(self.get_current_activity_with_details, hwnd)
+                time.sleep(min(poll, max(deadline - time.monotonic(), 0)))
+                try:
+                    current_activity = future.result(timeout=interval * 3)
+                except FutureTimeoutError:
+                    logger.warning(f"[警告] 句柄 {hwnd} 获取Activity超时")
+                    continue
+                future = None
+
+                if current_activity and current_activity.full != last_activity:
+                    logger.info(f"[监控] Activity变化: {last_activity} -> {current_activity.full}")
                     activity_history.append(current_activity)
-                    last_activity = current_activity['full_activity']
-
-                time.sleep(interval)
+                    last_activity = current_activity.full
+                    # 刚发生变化，后续可能还有连续切换，缩回最短间隔
+                    poll = ACTIVITY_POLL_MIN
+                else:
+                    poll = min(poll * 2, interval)
 
-            print(f"[监控] 监控结束，共检测到 {len(activity_history)} 次Activity变化")
+            logger.info(f"[监控] 监控结束，共检测到 {len(activity_history)} 次Activity变化")
             return activity_history
 
         except Exception as e:
-            print(f"[错误] Activity监控失败: {e}")
+            logger.error(f"[错误] Activity监控失败: {e}")
             return activity_history
+        finally:
+            if watching:
+                self._release_activity_watcher(hwnd)
+
+    def _monitor_by_events(self, hwnd: int, deadline: float, activity_history: List[ActivityRecord]) -> Optional[str]:
+        """
+        消费logcat推送的Activity变化，直到截止时间或推送进程退出
+
+        Args:
+            hwnd (int): 窗口句柄
+            deadline (float): 截止时间(time.monotonic)
+            activity_history (List[ActivityRecord]): 变化记录，原地追加
+
+        Returns:
+            Optional[str]: 最后一次记录的Activity
+        """
+        events = queue.Queue()
+        self._add_activity_listener(hwnd, events.put)
+        try:
+            # 先记录当前Activity，之后只处理推送的变化
+            last_activity = None
+            current_activity = self.get_current_activity_with_details(hwnd)
+            if current_activity:
+                logger.info(f"[监控] Activity变化: {last_activity} -> {current_activity.full}")
+                activity_history.append(current_activity)
+                last_activity = current_activity.full
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return last_activity
+                try:
+                    activity = events.get(timeout=min(remaining, 1.0))
+                except queue.Empty:
+                    if not self._activity_watcher_alive(hwnd):
+                        logger.warning(f"[警告] 句柄 {hwnd} logcat推送已退出，改为轮询")
+                        return last_activity
+                    continue
+
+                if activity == last_activity:
+                    continue
+                current_activity = self._build_activity_info(hwnd, activity)
+                logger.info(f"[监控] Activity变化: {last_activity} -> {activity}")
+                activity_history.append(current_activity)
+                last_activity = activity
+        finally:
+            self._remove_activity_listener(hwnd, events.put)
+
+    def _start_activity_watcher(self, hwnd: int) -> bool:
+        """
+        启动（或复用）句柄的logcat进程，Activity启动/显示时推送给已注册的回调
+        返回True时占用一次引用，使用结束后需调用_release_activity_watcher归还
+
+        Args:
+            hwnd (int): 窗口句柄
+
+        Returns:
+            bool: 推送是否可用
+        """
+        if not self.adb_available or hwnd not in self.hwnd_to_port:
+            return False
+
+        with self._watchers_lock:
+            proc = self._watchers.get(hwnd)
+            if proc is not None and proc.poll() is None:
+                self._watcher_refs[hwnd] = self._watcher_refs.get(hwnd, 0) + 1
+                return True
+
+            try:
+                # -T 1 只从最新一行开始跟随，不回放历史日志
+                proc = subprocess.Popen(
+                    self._adb_prefix(hwnd) + ['shell', 'logcat', '-T', '1',
+                                              'ActivityTaskManager:I', 'ActivityManager:I', '*:S'],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    encoding='utf-8',
+                    errors='ignore',
+                    creationflags=_CREATE_NO_WINDOW
+                )
+            except Exception as e:
+                print(f"[警告] 句柄 {hwnd} 启动logcat推送失败，使用轮询: {e}")
+                return False
+
+            self._watchers[hwnd] = proc
+            self._watcher_refs[hwnd] = self._watcher_refs.get(hwnd, 0) + 1
+
+        reader = threading.Thread(target=self._pump_activity_events, args=(hwnd, proc), daemon=True)
+        reader.start()
+        return True
+
+    def _pump_activity_events(self, hwnd: int, proc: subprocess.Popen):
+        """
+        后台线程：逐行读取logcat，解析出Activity后更新缓存并通知回调
+        """
+        try:
+            for line in proc.stdout:
+                match = _RE_LOGCAT_ACT.search(line)
+                if not match:
+                    continue
+                activity = match.group(1)
+                self._activity_cache[hwnd] = (time.monotonic(), activity)
+                with self._watchers_lock:
+                    listeners = list(self._activity_listeners.get(hwnd, ()))
+                for listener in listeners:
+                    listener(activity)
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._watchers_lock:
+                if self._watchers.get(hwnd) is proc:
+                    self._watchers.pop(hwnd, None)
+
+    def _activity_watcher_alive(self, hwnd: int) -> bool:
+        """
+        句柄的logcat推送进程是否仍在运行
+        """
+        proc = self._watchers.get(hwnd)
+        return proc is not None and proc.poll() is None
+
+    def _release_activity_watcher(self, hwnd: int):
+        """
+        归还_start_activity_watcher占用的引用，最后一个使用者归还时结束logcat推送进程
+        """
+        with self._watchers_lock:
+            refs = self._watcher_refs.get(hwnd, 0) - 1
+            if refs > 0:
+                self._watcher_refs[hwnd] = refs
+                return
+            self._watcher_refs.pop(hwnd, None)
+            proc = self._watchers.pop(hwnd, None)
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+
+    def _stop_activity_watcher(self, hwnd: int):
+        """
+        结束句柄的logcat推送进程（断开连接时调用，不论是否仍有使用者）
+        """
+        with self._watchers_lock:
+            self._watcher_refs.pop(hwnd, None)
+            proc = self._watchers.pop(hwnd, None)
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+
+    def _add_activity_listener(self, hwnd: int, listener: Callable[[str], None]):
+        """
+        注册Activity变化回调，回调在logcat读取线程中执行
+        """
+        with self._watchers_lock:
+            self._activity_listeners.setdefault(hwnd, []).append(listener)
 
-    def wait_for_activity(self, hwnd: int, target_activity: str, timeout: int = 30) -> bool:
+    def _remove_activity_listener(self, hwnd: int, listener: Callable[[str], None]):
+        """
+        注销Activity变化回调
+        """
+        with self._watchers_lock:
+            listeners = self._activity_listeners.get(hwnd)
+            if listeners and listener in listeners:
+                listeners.remove(listener)
+
+    def wait_for_activity(self, hwnd: int, target_activity: str, timeout: int = 30,
+                          interval: float = 1.0) -> bool:
         """
         等待特定Activity出现
 
@@ -1022,38 +1873,102 @@ class ADBAppManager:
             hwnd (int): 窗口句柄
             target_activity (str): 目标Activity名称
             timeout (int): 超时时间(秒)
+            interval (float): 最长检查间隔(秒)，从ACTIVITY_POLL_MIN开始逐次翻倍到该值
 
         Returns:
             bool: 是否等到目标Activity
         """
-        start_time = time.time()
+        # 已经在目标界面时直接返回（可命中Activity缓存），不进入等待流程
+        if self.is_activity_running(hwnd, target_activity):
+            logger.info(f"[成功] 等到目标Activity: {target_activity}")
+            return True
 
-        print(f"[等待] 等待Activity: {target_activity}，超时: {timeout}秒")
+        deadline = time.monotonic() + timeout
+        poll = ACTIVITY_POLL_MIN
+        last_activity = None
+        matches = compile_activity_matcher(target_activity)
+
+        logger.info(f"[等待] 等待Activity: {target_activity}，超时: {timeout}秒")
 
+        watching = False
         try:
-            while time.time() - start_time < timeout:
+            # 优先等待logcat推送，推送不可用或中途退出时剩余时间改为轮询
+            watching = self._start_activity_watcher(hwnd)
+            if watching and self._wait_by_events(hwnd, matches, deadline):
+                logger.info(f"[成功] 等到目标Activity: {target_activity}")
+                return True
+
+            while time.monotonic() < deadline:
                 current_activity = self.get_current_activity(hwnd)
 
                 if current_activity:
-                    print(f"[等待] 当前Activity: {current_activity}")
-
                     # 支持精确匹配和模糊匹配
-                    if current_activity == target_activity or target_activity in current_activity:
-                        print(f"[成功] 等到目标Activity: {target_activity}")
+                    if matches(current_activity):
+                        logger.info(f"[成功] 等到目标Activity: {target_activity}")
+                        # 界面已切换，后续查询不再使用切换前的缓存
+                        self._activity_cache.pop(hwnd, None)
                         return True
 
-                time.sleep(1)  # 每秒检查一次
+                # 界面有变化说明正在切换，缩回最短间隔；否则逐次翻倍
+                if current_activity != last_activity:
+                    # 只在Activity变化时输出，避免每次轮询都打印
+                    logger.info(f"[等待] 当前Activity: {current_activity}")
+                    last_activity = current_activity
+                    poll = ACTIVITY_POLL_MIN
+                else:
+                    poll = min(poll * 2, interval)
+
+                time.sleep(min(poll, max(deadline - time.monotonic(), 0)))
 
-            print(f"[超时] 未等到目标Activity: {target_activity}")
+            logger.warning(f"[超时] 未等到目标Activity: {target_activity}")
             return False
 
         except Exception as e:
-            print(f"[错误] 等待Activity失败: {e}")
+            logger.error(f"[错误] 等待Activity失败: {e}")
             return False
+        finally:
+            if watching:
+                self._release_activity_watcher(hwnd)
+
+    def _wait_by_events(self, hwnd: int, matches: Callable[[str], bool], deadline: float) -> bool:
+        """
+        等待logcat推送的Activity命中目标，命中后立即返回
+
+        Args:
+            hwnd (int): 窗口句柄
+            matches (Callable[[str], bool]): compile_activity_matcher生成的匹配函数
+            deadline (float): 截止时间(time.monotonic)
+
+        Returns:
+            bool: 是否等到目标Activity，推送进程退出时返回False
+        """
+        arrived = threading.Event()
+
+        def on_activity(activity: str):
+            if matches(activity):
+                arrived.set()
+
+        self._add_activity_listener(hwnd, on_activity)
+        try:
+            # 注册回调后再查一次当前Activity，避免错过注册前已经完成的切换
+            if matches(self.get_current_activity(hwnd)):
+                return True
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if arrived.wait(timeout=min(remaining, 1.0)):
+                    return True
+                if not self._activity_watcher_alive(hwnd):
+                    logger.warning(f"[警告] 句柄 {hwnd} logcat推送已退出，改为轮询")
+                    return False
+        finally:
+            self._remove_activity_listener(hwnd, on_activity)
 
     def is_activity_running(self, hwnd: int, target_activity: str) -> bool:
         """
-        检查指定Activity是否正在运行
+        检查指定Activity是否正在运行，与get_current_activity共用Activity缓存
 
         Args:
             hwnd (int): 窗口句柄
@@ -1063,11 +1978,25 @@ class ADBAppManager:
             bool: Activity是否正在运行
         """
         try:
-            current_activity = self.get_current_activity(hwnd)
-            if current_activity:
-                return current_activity == target_activity or target_activity in current_activity
-            return False
+            return compile_activity_matcher(target_activity)(self.get_current_activity(hwnd))
 
         except Exception as e:
             print(f"[错误] 检查Activity运行状态失败: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def is_activity_running_cached(self, hwnd: int, target_activity: str, max_age: float = 1.0) -> Optional[bool]:
+        """
+        只根据缓存的当前Activity检查目标Activity是否正在运行，不执行ADB命令
+
+        Args:
+            hwnd (int): 窗口句柄
+            target_activity (str): 目标Activity名称
+            max_age (float): 缓存最长可接受的时间(秒)
+
+        Returns:
+            Optional[bool]: Activity是否正在运行，缓存不存在或已过期返回None
+        """
+        cached = self._activity_cache.get(hwnd)
+        if not cached or time.monotonic() - cached[0] > max_age:
+            return None
+        return compile_activity_matcher(target_activity)(cached[1])
@@ -3,14 +3,19 @@ import asyncio
 import concurrent.futures
 import sys
 import os
+import threading
 import time
+import uuid
+import weakref
 import logging
-from typing import Optional, Tuple, List, Callable, Any, Dict, Union, Coroutine
+from typing import Optional, Tuple, List, Callable, Any, Dict, Union, Coroutine, ClassVar, FrozenSet, Set
 from pathlib import Path
-from functools import wraps
+from functools import wraps, partial
 from dataclasses import dataclass
 from enum import Enum
 
+import cv2
+import numpy as np
 
 # 导入自定义模块
 from util.adb_utils import LeidianADB
@@ -23,6 +28,81 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 两帧dHash的汉明距离小于该值时视为画面未变化，直接复用上次的匹配结果
+SCREEN_HASH_THRESHOLD = 4
+# 匹配结果最长复用时间（秒），dHash分辨率较低，超时后强制重新识别以免漏掉小范围变化
+MATCH_CACHE_MAX_AGE = 2.0
+# 画面静止时轮询间隔的上限（秒），每连续3帧未变化间隔翻倍
+MAX_POLL_INTERVAL = 2.0
+# 区域查找中模板匹配(TM_CCOEFF_NORMED)直接采信的最低相关系数，越高越严格；
+# 与特征匹配的match_ratio（Lowe比值，越低越严格）含义相反，不能共用同一个阈值
+TEMPLATE_MATCH_THRESHOLD = 0.9
+# 滑动结束后到下一次检查前至少等待的时间（秒），让列表惯性滚动停下来再截图
+SWIPE_SETTLE_TIME = 0.3
+# 视为图片模板的文件扩展名
+IMAGE_EXTENSIONS: FrozenSet[str] = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.gif'})
+
+
+def dhash(img: np.ndarray) -> int:
+    """
+    计算图像的64位差异哈希（缩放为9x8灰度图，比较水平相邻像素）
+
+    Args:
+        img: BGR或灰度图像
+
+    Returns:
+        64位哈希值
+    """
+    # 先缩放再转灰度：灰度转换只作用于72个像素，而不是整帧
+    small = cv2.resize(img, (9, 8), interpolation=cv2.INTER_AREA)
+    if small.ndim == 3:
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+def cuda_available() -> bool:
+    """检测当前环境是否可用CUDA（EasyOCR基于torch）"""
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except Exception:
+        return False
+
+
+def match_template_roi(roi: np.ndarray, template: np.ndarray) -> Optional[Tuple[float, Tuple[int, int]]]:
+    """
+    在区域图像上做归一化模板匹配
+
+    Args:
+        roi: 区域图像（BGR或灰度）
+        template: 灰度模板图像
+
+    Returns:
+        (最高相似度, 最佳位置左上角)，模板大于区域时返回None
+    """
+    if roi.ndim == 3:
+        roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+    if roi.shape[0] < template.shape[0] or roi.shape[1] < template.shape[1]:
+        return None
+    scores = cv2.matchTemplate(np.ascontiguousarray(roi), template, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(scores)
+    return max_val, max_loc
+
+
+def hash_distance(a: int, b: int) -> int:
+    """两个dHash之间的汉明距离"""
+    return (a ^ b).bit_count()
+
+
+def _frame_key(frame: Optional[np.ndarray]) -> Optional[int]:
+    """
+    探测合并键中的画面标识：同一帧对象共享探测，未传入画面（各自截图）时为None
+
+    探测执行期间闭包持有该帧，id在此期间不会被复用
+    """
+    return id(frame) if frame is not None else None
+
 
 class SearchDirection(Enum):
     """滑动搜索方向"""
@@ -73,6 +153,48 @@ class MatchResult:
     text: Optional[str] = None
     error: Optional[str] = None
 
+    def __bool__(self) -> bool:
+        # 兼容按bool判断等待结果的旧调用方式
+        return self.success
+
+
+class TargetKind(Enum):
+    """操作目标类型"""
+    COORD = "coord"  # 坐标
+    IMAGE = "image"  # 图片路径
+    TEXT = "text"  # 文字
+    MATCH_RESULT = "match_result"  # 匹配结果
+
+
+@dataclass
+class ResolvedTarget:
+    """归类后的操作目标"""
+    kind: TargetKind
+    value: Any
+
+
+def _classify(target: Any) -> Optional[ResolvedTarget]:
+    """
+    将操作目标归类为坐标、图片、文字或匹配结果
+
+    Args:
+        target: 坐标元组、图片路径、文字或MatchResult
+
+    Returns:
+        ResolvedTarget，无法识别时返回None
+    """
+    if isinstance(target, MatchResult):
+        return ResolvedTarget(TargetKind.MATCH_RESULT, target)
+    if isinstance(target, tuple) and len(target) == 2:
+        return ResolvedTarget(TargetKind.COORD, target)
+    if isinstance(target, Path):
+        return ResolvedTarget(TargetKind.IMAGE, str(target))
+    if isinstance(target, str):
+        if os.path.splitext(target)[1].lower() in IMAGE_EXTENSIONS:
+            return ResolvedTarget(TargetKind.IMAGE, target)
+        return ResolvedTarget(TargetKind.TEXT, target)
+    return None
+
 
 class AsyncADBHelper:
     """
@@ -80,11 +202,35 @@ class AsyncADBHelper:
     使用adb_utils和EasyOCRTool替代Airtest功能
     """
 
+    # 所有实例共用的线程池，避免多模拟器时每个实例各自创建线程
+    _shared_pool: ClassVar[Optional[concurrent.futures.ThreadPoolExecutor]] = None
+    _shared_pool_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _get_shared_pool(cls, max_workers: int) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        获取共享线程池，首次调用时创建
+
+        Args:
+            max_workers: 期望的最大工作线程数，不超过CPU核数
+
+        Returns:
+            共享的线程池
+        """
+        with AsyncADBHelper._shared_pool_lock:
+            if AsyncADBHelper._shared_pool is None:
+                AsyncADBHelper._shared_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max(2, min(max_workers, os.cpu_count() or 1)),
+                    thread_name_prefix="adb_async_"
+                )
+            return AsyncADBHelper._shared_pool
+
     def __init__(self,
                  emulator_port: int = 5555,
                  ld_console_path: Optional[str] = None,
                  max_workers: int = 5,
-                 use_thread_pool: bool = True):
+                 use_thread_pool: bool = True,
+                 force_cpu: bool = False):
         """
         初始化异步助手
 
@@ -93,6 +239,7 @@ class AsyncADBHelper:
             ld_console_path: 雷电控制台路径
             max_workers: 线程池最大工作线程数
             use_thread_pool: 是否使用线程池处理阻塞操作
+            force_cpu: 强制OCR使用CPU（GPU需留给游戏渲染时使用）
         """
         self.emulator_port = emulator_port
         self.ld_console_path = ld_console_path
@@ -100,28 +247,43 @@ class AsyncADBHelper:
         # 初始化ADB工具（同步方式）
         self.adb = LeidianADB(emulator_port=emulator_port, ld_console_path=ld_console_path)
 
-        # 初始化OCR工具（同步方式）
-        self.ocr = EasyOCRTool(lang=['ch_sim', 'en'], gpu=False)
+        # 初始化OCR工具（同步方式），有可用CUDA时使用GPU加速
+        self.ocr_gpu = not force_cpu and cuda_available()
+        self.ocr = EasyOCRTool(lang=['ch_sim', 'en'], gpu=self.ocr_gpu)
+        # 纯英文/数字目标使用的英文OCR，首次需要时再加载
+        self._ocr_en: Optional[EasyOCRTool] = None
+        self._ocr_en_future: Optional[asyncio.Future] = None
 
         # 异步相关
         self.max_workers = max_workers
         self.use_thread_pool = use_thread_pool
-        self.thread_pool = concurrent.futures.ThreadPoolExecutor(
-            max_workers=max_workers,
-            thread_name_prefix="adb_async_"
-        )
-
-        # 事件循环
-        self.loop = None
-        self._init_event_loop()
+        self.thread_pool = self._get_shared_pool(max_workers)
+
+        # 画面未变化时复用匹配结果 {(类型, 目标, 阈值): MatchResult}
+        self._match_cache: Dict[tuple, MatchResult] = {}
+        self._last_dhash: Optional[int] = None
+        self._match_cache_time = 0.0
+        # 模板最佳匹配缩放比例 {模板路径: 缩放比例}，屏幕分辨率变化时清空
+        self._scale_cache: Dict[str, float] = {}
+        self._scale_cache_resolution: Optional[Tuple[int, int]] = None
+        # 区域模板匹配使用的灰度模板 {模板路径: (修改时间, 灰度图像)}
+        self._template_gray: Dict[str, Tuple[float, np.ndarray]] = {}
+        # 各类型头像存在的模板路径 {头像类型: [模板路径]}
+        self._avatar_templates: Dict[str, List[str]] = {}
+        # 正在执行的探测 {(类型, 目标, 阈值, 画面id): Future}，同一画面上的相同探测并发时共享结果
+        self._inflight_probes: Dict[tuple, asyncio.Future] = {}
+        # 正在等待各目标的 wait_element_async {目标: {每个等待方自己的Event}}，
+        # 其他调用探测到同一目标时只唤醒这些等待方，无需等满间隔
+        self._target_waiters: Dict[str, Set[asyncio.Event]] = {}
 
         # 状态跟踪
-        self.active_tasks = set()
-        self.screenshots_dir = Path("screenshots")
-        self.screenshots_dir.mkdir(exist_ok=True)
+        # 任务结束后自动移除；任务在运行期间由等待方持有强引用
+        self.active_tasks: weakref.WeakSet = weakref.WeakSet()
 
         # 设置项目路径
         self._setup_project_paths()
+        self.screenshots_dir = Path(self.project_root) / "screenshots"
+        self.screenshots_dir.mkdir(exist_ok=True)
 
     def _setup_project_paths(self):
         """设置项目路径"""
@@ -132,22 +294,43 @@ class AsyncADBHelper:
         # 图片目录
         self.images_dir = os.path.join(self.project_root, "images")
 
-        # 设置工作目录到项目根目录
-        os.chdir(self.project_root)
-        # 添加项目根目录到Python路径
-        sys.path.insert(0, self.project_root)
+        # 添加项目根目录到Python路径（不修改进程工作目录，文件路径均基于项目根目录）
+        if self.project_root not in sys.path:
+            sys.path.insert(0, self.project_root)
 
         logger.info(f"项目根目录: {self.project_root}")
         logger.info(f"脚本目录: {self.script_dir}")
         logger.info(f"图片目录: {self.images_dir}")
 
-    def _init_event_loop(self):
-        """初始化事件循环"""
-        try:
-            self.loop = asyncio.get_event_loop()
-        except RuntimeError:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
+    def _resolve_path(self, path: Union[str, Path]) -> str:
+        """
+        解析相对路径，候选目录与EasyOCRTool.load_image一致：
+        原路径、项目根目录及其images/screenshots、当前工作目录及其images/screenshots
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            第一个存在的候选路径，都不存在时返回原路径
+        """
+        path = str(path)
+        if os.path.isabs(path):
+            return path
+
+        cwd = os.getcwd()
+        candidates = (
+            path,
+            os.path.join(self.project_root, path),
+            os.path.join(self.images_dir, path),
+            os.path.join(self.screenshots_dir, path),
+            os.path.join(cwd, path),
+            os.path.join(cwd, "images", path),
+            os.path.join(cwd, "screenshots", path),
+        )
+        for candidate in candidates:
+            if os.path.exists(candidate):
+                return candidate
+        return path
 
     def connect_sync(self) -> bool:
         """同步连接设备（供同步代码使用）"""
@@ -180,6 +363,20 @@ class AsyncADBHelper:
             logger.error(f"设备连接异常: {e}")
             return False
 
+    def _make_invoker(self, func: Callable) -> Callable[..., Coroutine]:
+        """
+        将函数统一包装为可await的调用：协程函数直接返回，同步函数放入线程池执行
+
+        Args:
+            func: 协程函数或同步函数
+
+        Returns:
+            返回协程的可调用对象
+        """
+        if asyncio.iscoroutinefunction(func):
+            return func
+        return partial(self.run_in_threadpool, func)
+
     async def run_in_threadpool(self, func: Callable, *args, **kwargs) -> Any:
         """
         在线程池中运行阻塞函数
@@ -194,18 +391,20 @@ class AsyncADBHelper:
         if not self.use_thread_pool:
             return func(*args, **kwargs)
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.thread_pool,
-            lambda: func(*args, **kwargs)
-        )
+        if kwargs:
+            func = partial(func, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.thread_pool, func, *args)
 
     async def wait_element_async(self,
                                  target: Union[str, Path],
                                  config: WaitConfig = None,
-                                 strategy: MatchStrategy = MatchStrategy.BOTH) -> bool:
+                                 strategy: MatchStrategy = MatchStrategy.BOTH) -> MatchResult:
         """
         异步等待元素出现（修正策略判断逻辑）
+
+        Returns:
+            MatchResult: 成功时包含元素位置，可直接按bool判断是否找到
         """
         if config is None:
             config = WaitConfig()
@@ -213,70 +412,103 @@ class AsyncADBHelper:
         await self.ensure_connected()
 
         start_time = time.time()
-        result = False
 
         # 根据target类型自动判断策略
-        target_str = str(target)
-        is_image_file = target_str.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif'))
+        resolved = _classify(target)
+        is_image_file = resolved is not None and resolved.kind == TargetKind.IMAGE
+        if is_image_file:
+            target = self._resolve_path(resolved.value)
+            # 图片文件不存在时任何探测都不可能成功，不再对路径字符串做OCR
+            if not os.path.exists(target):
+                logger.warning(f"图片文件不存在: {target}")
+                return MatchResult(success=False, error=f"图片文件不存在: {target}")
+
+        def image_probe(frame):
+            return self.exists_image_async(target, frame=frame)
+
+        def text_probe(frame):
+            return self.exists_text_async(target, frame=frame)
+
+        # 在循环外一次性确定探测顺序
+        if strategy == MatchStrategy.IMAGE:
+            probes = [image_probe]
+        elif strategy == MatchStrategy.OCR:
+            probes = [text_probe]
+        elif strategy == MatchStrategy.PRIORITY_IMAGE:
+            probes = [image_probe, text_probe] if is_image_file else [text_probe]
+        elif strategy == MatchStrategy.PRIORITY_OCR:
+            probes = [text_probe, image_probe] if is_image_file else [text_probe]
+        else:
+            # 图片目标只做特征匹配，文字目标只做OCR
+            probes = [image_probe] if is_image_file else [text_probe]
 
-        while time.time() - start_time < config.timeout:
-            try:
-                # 如果是指定策略或自动判断为图片，尝试图片匹配
-                should_try_image = (
-                        strategy in [MatchStrategy.IMAGE, MatchStrategy.BOTH, MatchStrategy.PRIORITY_IMAGE] or
-                        (strategy == MatchStrategy.BOTH and is_image_file) or
-                        (strategy == MatchStrategy.PRIORITY_IMAGE and is_image_file)
-                )
+        # 每个等待方使用自己的Event，按目标登记，只会被同一目标的探测成功唤醒
+        wake = asyncio.Event()
+        wake_key = str(target)
+        self._target_waiters.setdefault(wake_key, set()).add(wake)
+        try:
+            result = await self._poll_element(probes, config, start_time, wake)
+        finally:
+            waiters = self._target_waiters.get(wake_key)
+            if waiters is not None:
+                waiters.discard(wake)
+                if not waiters:
+                    del self._target_waiters[wake_key]
 
-                # 如果是指定策略或自动判断为文字，尝试文字匹配
-                should_try_text = (
-                        strategy in [MatchStrategy.OCR, MatchStrategy.BOTH, MatchStrategy.PRIORITY_OCR] or
-                        (strategy == MatchStrategy.BOTH and not is_image_file) or
-                        (strategy == MatchStrategy.PRIORITY_OCR and not is_image_file)
-                )
+        if not result and config.raise_error:
+            if config.screenshot_on_fail:
+                await self.take_screenshot_async("wait_element_failed.png")
+            raise TimeoutError(f"等待元素超时: {target}")
 
-                # 根据优先级决定执行顺序
-                if strategy == MatchStrategy.PRIORITY_IMAGE:
-                    # 优先图片匹配
-                    if should_try_image:
-                        result_obj = await self.exists_image_async(target)
-                        result = result_obj.success
-                        if result:
-                            break
-
-                    if should_try_text and not result:
-                        result_obj = await self.exists_text_async(target)
-                        result = result_obj.success
-                        if result:
-                            break
-
-                elif strategy == MatchStrategy.PRIORITY_OCR:
-                    # 优先文字匹配
-                    if should_try_text:
-                        result_obj = await self.exists_text_async(target)
-                        result = result_obj.success
-                        if result:
-                            break
-
-                    if should_try_image and not result:
-                        result_obj = await self.exists_image_async(target)
-                        result = result_obj.success
-                        if result:
-                            break
+        return result
+
+    async def _poll_element(self,
+                            probes: List[Callable],
+                            config: WaitConfig,
+                            start_time: float,
+                            wake: asyncio.Event) -> MatchResult:
+        """
+        wait_element_async 的轮询循环：按顺序探测，失败后等待间隔或被同一目标的探测成功提前唤醒
+
+        Args:
+            probes: 按顺序执行的探测函数
+            config: 等待配置
+            start_time: 开始等待的时间
+            wake: 本等待方的唤醒事件
+
+        Returns:
+            MatchResult: 匹配结果，超时返回失败结果
+        """
+        result = MatchResult(success=False)
+        # 画面连续静止的帧数，用于自适应调整轮询间隔
+        static_frames = 0
+        prev_hash: Optional[int] = None
+        current_interval = config.interval
 
+        while time.time() - start_time < config.timeout:
+            # 本轮截图之后的唤醒才有意义，之前的通知已被这一帧覆盖
+            wake.clear()
+            try:
+                # 每轮只截一次图，图片和文字匹配共用同一帧
+                frame = await self._grab_frame_ndarray()
+
+                # 画面静止时逐步放慢轮询，画面变化时立即恢复
+                frame_hash = await self.run_in_threadpool(dhash, frame) if frame is not None else None
+                if (frame_hash is not None and prev_hash is not None
+                        and hash_distance(frame_hash, prev_hash) < SCREEN_HASH_THRESHOLD):
+                    static_frames += 1
                 else:
-                    # BOTH 或 IMAGE/OCR 策略，同时尝试
-                    if should_try_image:
-                        result_obj = await self.exists_image_async(target)
-                        result = result_obj.success
-                        if result:
-                            break
-
-                    if should_try_text and not result:
-                        result_obj = await self.exists_text_async(target)
-                        result = result_obj.success
-                        if result:
-                            break
+                    static_frames = 0
+                prev_hash = frame_hash
+                current_interval = min(MAX_POLL_INTERVAL,
+                                       config.interval * (1 << min(static_frames // 3, 2)))
+
+                # 按预先确定的顺序依次探测，任一成功即结束等待
+                for probe in probes:
+                    match = await probe(frame)
+                    if match.success:
+                        result = match
+                        break
 
                 if result:
                     break
@@ -284,54 +516,209 @@ class AsyncADBHelper:
             except Exception as e:
                 logger.debug(f"等待元素时出错: {e}")
 
-            await asyncio.sleep(config.interval)
-
-        if not result and config.raise_error:
-            if config.screenshot_on_fail:
-                await self.take_screenshot_async("wait_element_failed.png")
-            raise TimeoutError(f"等待元素超时: {target}")
+            try:
+                async with asyncio.timeout(current_interval):
+                    await wake.wait()
+            except TimeoutError:
+                pass
 
         return result
 
+    def _notify_target_waiters(self, target: Union[str, Path]):
+        """
+        唤醒正在等待该目标的 wait_element_async
+
+        Args:
+            target: 探测成功的目标（图片路径或文字）
+        """
+        for wake in self._target_waiters.get(str(target), ()):
+            wake.set()
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """
+        创建后台任务并加入 active_tasks 跟踪，关闭时统一取消
+
+        调用方需持有返回的任务（active_tasks 只保存弱引用）
+
+        Args:
+            coro: 协程
+
+        Returns:
+            创建的任务
+        """
+        task = asyncio.ensure_future(coro)
+        self.active_tasks.add(task)
+        return task
+
+    async def _grab_frame_ndarray(self) -> Optional[np.ndarray]:
+        """
+        异步截图并在内存中解码为图像数组（不经过PNG文件读写）
+
+        Returns:
+            BGR图像数组，失败返回None
+        """
+        try:
+            data = await self.run_in_threadpool(self.adb.capture_screen_bytes)
+            if not data:
+                return None
+            return await self.run_in_threadpool(
+                cv2.imdecode, np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR
+            )
+        except Exception as e:
+            logger.error(f"截图失败: {e}")
+            return None
+
+    def _screen_unchanged(self, frame_hash: Optional[int]) -> bool:
+        """
+        判断画面相对缓存时是否未变化，变化时清空匹配结果缓存
+
+        Args:
+            frame_hash: 当前画面的dHash
+
+        Returns:
+            画面未变化且缓存未过期时返回True
+        """
+        if (frame_hash is not None and self._last_dhash is not None
+                and hash_distance(frame_hash, self._last_dhash) < SCREEN_HASH_THRESHOLD
+                and time.monotonic() - self._match_cache_time < MATCH_CACHE_MAX_AGE):
+            return True
+
+        self._match_cache.clear()
+        self._last_dhash = frame_hash
+        self._match_cache_time = time.monotonic()
+        return False
+
+    async def _dedup_probe(self, probe_key: tuple, probe: Callable[[], Coroutine]) -> MatchResult:
+        """
+        合并相同的并发探测：同一画面上的同一目标已有探测在执行时，直接等待其结果
+
+        Args:
+            probe_key: 探测键 (类型, 目标, 阈值, 画面id)
+            probe: 创建探测协程的函数
+
+        Returns:
+            MatchResult: 匹配结果
+        """
+        future = self._inflight_probes.get(probe_key)
+        if future is None:
+            future = self._spawn(probe())
+            self._inflight_probes[probe_key] = future
+
+            def _done(f, key=probe_key):
+                if self._inflight_probes.get(key) is f:
+                    del self._inflight_probes[key]
+
+            future.add_done_callback(_done)
+
+        # shield 避免某个等待方被取消时连带取消共享的探测
+        return await asyncio.shield(future)
+
+    def _load_template_gray(self, image_path: str) -> Optional[np.ndarray]:
+        """
+        读取灰度模板图片，按文件修改时间缓存
+
+        Args:
+            image_path: 模板图片路径
+
+        Returns:
+            灰度图像，读取失败返回None
+        """
+        try:
+            mtime = os.path.getmtime(image_path)
+        except OSError:
+            return None
+
+        cached = self._template_gray.get(image_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        template = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if template is not None:
+            self._template_gray[image_path] = (mtime, template)
+        return template
+
+    def _invalidate_match_cache(self):
+        """点击、滑动、输入等操作后清空匹配结果缓存"""
+        self._match_cache.clear()
+        self._last_dhash = None
+
     async def exists_image_async(self,
                                  image_path: Union[str, Path],
-                                 threshold: float = 0.8) -> MatchResult:
+                                 threshold: float = 0.8,
+                                 frame: Optional[np.ndarray] = None) -> MatchResult:
         """
         异步检查图片是否存在（使用特征匹配）
 
         Args:
             image_path: 图片路径
             threshold: 匹配阈值
+            frame: 已截取的画面，为None时重新截图
 
         Returns:
             MatchResult: 匹配结果
         """
+        image_path = self._resolve_path(image_path)
+        return await self._dedup_probe(
+            ('image', image_path, threshold, _frame_key(frame)),
+            lambda: self._probe_image(image_path, threshold, frame)
+        )
+
+    async def _probe_image(self,
+                           image_path: Union[str, Path],
+                           threshold: float,
+                           frame: Optional[np.ndarray]) -> MatchResult:
+        """执行图片匹配（exists_image_async 的实际实现）"""
         try:
             # 先截图
-            screenshot_path = await self.take_screenshot_async("temp_screenshot.png")
+            if frame is None:
+                frame = await self._grab_frame_ndarray()
+            if frame is None:
+                return MatchResult(success=False, error="截图失败")
+
+            # 画面未变化时直接返回上次的匹配结果
+            cache_key = ('image', str(image_path), threshold)
+            frame_hash = await self.run_in_threadpool(dhash, frame)
+            if self._screen_unchanged(frame_hash) and cache_key in self._match_cache:
+                return self._match_cache[cache_key]
+
+            # 分辨率变化后之前确定的模板缩放比例不再适用
+            if frame.shape[:2] != self._scale_cache_resolution:
+                self._scale_cache.clear()
+                self._scale_cache_resolution = frame.shape[:2]
+
+            # 已知最佳缩放比例时只匹配该尺度，否则多尺度匹配
+            best_scale = self._scale_cache.get(str(image_path))
+            scale_ratios = [best_scale] if best_scale is not None else [0.8, 1.0, 1.2]
 
             # 使用特征匹配
             result, _, _ = await self.run_in_threadpool(
                 self.ocr.feature_match,
                 str(image_path),
-                str(screenshot_path),
+                frame,
                 method="akaze",  # 优先使用AKAZE（抗干扰更强）
                 match_ratio=threshold,
                 min_matches=8,
+                draw_matches=False,
                 enhance_contrast=True,  # 增强对比度
                 denoise=True,  # 降噪
-                scale_ratios=[0.8, 1.0, 1.2]  # 多尺度匹配
+                scale_ratios=scale_ratios
             )
 
             if result and result.get('match_success', False):
-                return MatchResult(
+                self._scale_cache[str(image_path)] = result['scale']
+                match_result = MatchResult(
                     success=True,
                     position=result['center'],
                     confidence=result['confidence'],
                     bbox=result['bbox']
                 )
             else:
-                return MatchResult(success=False, confidence=0.0)
+                match_result = MatchResult(success=False, confidence=0.0)
+
+            self._match_cache[cache_key] = match_result
+            if match_result.success:
+                self._notify_target_waiters(image_path)
+            return match_result
 
         except Exception as e:
             logger.error(f"检查图片存在时出错: {e}")
@@ -339,32 +726,87 @@ class AsyncADBHelper:
 
     async def exists_text_async(self,
                                 text: str,
-                                confidence_threshold: float = 0.5) -> MatchResult:
+                                confidence_threshold: float = 0.5,
+                                frame: Optional[np.ndarray] = None) -> MatchResult:
         """
         异步检查文字是否存在
 
         Args:
             text: 要查找的文字
             confidence_threshold: 置信度阈值
+            frame: 已截取的画面，为None时重新截图
 
         Returns:
             MatchResult: 匹配结果
         """
+        return await self._dedup_probe(
+            ('text', text, confidence_threshold, _frame_key(frame)),
+            lambda: self._probe_text(text, confidence_threshold, frame)
+        )
+
+    async def _get_ocr_for(self, text: str) -> EasyOCRTool:
+        """
+        根据目标文字选择OCR工具：纯ASCII文字使用英文模型，跳过中文识别
+
+        Args:
+            text: 要查找的文字
+
+        Returns:
+            EasyOCRTool实例，英文模型加载失败时返回中英文模型
+        """
+        if not text.isascii():
+            return self.ocr
+
+        if self._ocr_en is None:
+            if self._ocr_en_future is None:
+                self._ocr_en_future = self._spawn(
+                    self.run_in_threadpool(EasyOCRTool, lang=['en'], gpu=self.ocr_gpu)
+                )
+            future = self._ocr_en_future
+            try:
+                self._ocr_en = await asyncio.shield(future)
+            except (Exception, asyncio.CancelledError) as e:
+                # 调用方自身被取消时照常抛出，只有加载任务失败或被close()取消时才回退
+                if isinstance(e, asyncio.CancelledError) and not future.cancelled():
+                    raise
+                if self._ocr_en is None:
+                    # 之后固定使用中英文模型，警告只输出一次
+                    logger.warning(f"英文OCR模型加载失败，使用中英文模型: {e!r}")
+                    self._ocr_en = self.ocr
+                self._ocr_en_future = None
+
+        return self._ocr_en
+
+    async def _probe_text(self,
+                          text: str,
+                          confidence_threshold: float,
+                          frame: Optional[np.ndarray]) -> MatchResult:
+        """执行文字识别（exists_text_async 的实际实现）"""
         try:
             # 先截图
-            screenshot_path = await self.take_screenshot_async("temp_screenshot.png")
-
-            # 使用OCR搜索文字
+            if frame is None:
+                frame = await self._grab_frame_ndarray()
+            if frame is None:
+                return MatchResult(success=False, error="截图失败")
+
+            # 画面未变化时直接返回上次的识别结果
+            cache_key = ('text', text, confidence_threshold)
+            frame_hash = await self.run_in_threadpool(dhash, frame)
+            if self._screen_unchanged(frame_hash) and cache_key in self._match_cache:
+                return self._match_cache[cache_key]
+
+            # 使用OCR搜索文字（纯ASCII目标只用英文模型）
+            ocr = await self._get_ocr_for(text)
             matches = await self.run_in_threadpool(
-                self.ocr.search_text,
-                str(screenshot_path),
+                ocr.search_text,
+                frame,
                 text,
                 confidence_threshold
             )
 
             if matches:
                 best_match = matches[0]  # 取置信度最高的匹配
-                return MatchResult(
+                match_result = MatchResult(
                     success=True,
                     position=best_match['center'],
                     confidence=best_match['confidence'],
@@ -372,7 +814,12 @@ class AsyncADBHelper:
                     text=best_match['text']
                 )
             else:
-                return MatchResult(success=False, confidence=0.0)
+                match_result = MatchResult(success=False, confidence=0.0)
+
+            self._match_cache[cache_key] = match_result
+            if match_result.success:
+                self._notify_target_waiters(text)
+            return match_result
 
         except Exception as e:
             logger.error(f"检查文字存在时出错: {e}")
@@ -397,35 +844,12 @@ class AsyncADBHelper:
             await asyncio.sleep(wait_before)
 
         try:
-            position = None
-
-            # 处理不同类型的target
-            if isinstance(target, tuple) and len(target) == 2:
-                # 直接坐标
-                position = target
-
-            elif isinstance(target, (str, Path)):
-                # 图片路径或文字
-                result = await self.wait_element_async(str(target))
-                if hasattr(result, 'position') and result.position:
-                    position = result.position
-                elif isinstance(result, bool) and result:
-                    # 如果是bool True，尝试获取元素位置
-                    if isinstance(target, Path) or (
-                            isinstance(target, str) and target.endswith(('.png', '.jpg', '.jpeg'))):
-                        img_result = await self.exists_image_async(str(target))
-                        position = img_result.position if img_result.success else None
-                    else:
-                        text_result = await self.exists_text_async(str(target))
-                        position = text_result.position if text_result.success else None
-
-            elif isinstance(target, MatchResult) and target.success:
-                # MatchResult对象
-                position = target.position
+            position = await self._resolve_position_async(_classify(target))
 
             if position:
                 x, y = int(position[0]), int(position[1])
                 success = await self.run_in_threadpool(self.adb.safe_tap, x, y)
+                self._invalidate_match_cache()
 
                 if wait_after > 0:
                     await asyncio.sleep(wait_after)
@@ -439,6 +863,45 @@ class AsyncADBHelper:
             logger.error(f"点击操作失败: {e}")
             return False
 
+    async def _exists_target_async(self,
+                                   resolved: ResolvedTarget,
+                                   threshold: Optional[float] = None) -> MatchResult:
+        """
+        按目标类型检查图片或文字是否存在
+
+        Args:
+            resolved: 归类后的目标（IMAGE或TEXT）
+            threshold: 匹配阈值，为None时使用各自的默认值
+
+        Returns:
+            MatchResult: 匹配结果
+        """
+        probe = self.exists_image_async if resolved.kind == TargetKind.IMAGE else self.exists_text_async
+        if threshold is None:
+            return await probe(resolved.value)
+        return await probe(resolved.value, threshold)
+
+    async def _resolve_position_async(self, resolved: Optional[ResolvedTarget]) -> Optional[Tuple[float, float]]:
+        """
+        获取目标的操作坐标，图片或文字目标会先等待其出现
+
+        Args:
+            resolved: 归类后的目标
+
+        Returns:
+            坐标，无法确定时返回None
+        """
+        if resolved is None:
+            return None
+        if resolved.kind == TargetKind.COORD:
+            return resolved.value
+        if resolved.kind == TargetKind.MATCH_RESULT:
+            return resolved.value.position if resolved.value.success else None
+
+        # 图片路径或文字，等待结果中已包含位置
+        result = await self.wait_element_async(resolved.value)
+        return result.position if result.success else None
+
     async def swipe_find_element_async(self,
                                        target: Union[str, Path],
                                        search_config: SearchConfig = None,
@@ -465,11 +928,7 @@ class AsyncADBHelper:
         found = await self.wait_element_async(target, wait_config)
         if found:
             logger.info("直接找到元素，无需滑动")
-            # 返回具体的匹配结果
-            if isinstance(target, Path) or (isinstance(target, str) and target.endswith(('.png', '.jpg', '.jpeg'))):
-                return await self.exists_image_async(str(target))
-            else:
-                return await self.exists_text_async(str(target))
+            return found
 
         # 滑动查找
         screen_width, screen_height = await self.get_screen_size_async()
@@ -544,6 +1003,7 @@ class AsyncADBHelper:
                 self.adb.safe_swipe,
                 start_x, start_y, end_x, end_y, duration_ms
             )
+            self._invalidate_match_cache()
             logger.debug(f"滑动成功: {direction.value}")
             return success
         except Exception as e:
@@ -555,14 +1015,9 @@ class AsyncADBHelper:
                                                     search_config: SearchConfig) -> Optional[MatchResult]:
         """在当前屏幕中查找元素"""
         try:
-            if isinstance(target, (str, Path)):
-                target_str = str(target)
-                if target_str.endswith(('.png', '.jpg', '.jpeg')):
-                    # 图片匹配
-                    return await self.exists_image_async(target_str, search_config.match_threshold)
-                else:
-                    # 文字匹配
-                    return await self.exists_text_async(target_str, search_config.match_threshold)
+            resolved = _classify(target)
+            if resolved is not None and resolved.kind in (TargetKind.IMAGE, TargetKind.TEXT):
+                return await self._exists_target_async(resolved, search_config.match_threshold)
             return None
         except Exception as e:
             logger.error(f"查找元素失败: {e}")
@@ -581,7 +1036,7 @@ class AsyncADBHelper:
             logger.error(f"获取屏幕尺寸失败: {e}")
             return 1080, 1920  # 默认值
 
-    async def take_screenshot_async(self, filename: str = None) -> Path | str:
+    async def take_screenshot_async(self, filename: Optional[str] = None) -> Path:
         """
         异步截图
 
@@ -591,24 +1046,34 @@ class AsyncADBHelper:
         Returns:
             截图文件路径
         """
-        if filename is None:
-            filename = f"screenshot.png"
-
-        filepath =  filename
+        filepath: Path = self.screenshots_dir / (filename or "screenshot.png")
 
         try:
-            screenshot_path = await self.run_in_threadpool(self.adb.capture_screen, str(filepath))
-            if screenshot_path and os.path.exists(screenshot_path):
-                logger.info(f"截图已保存: {screenshot_path}")
-                return Path(screenshot_path)
-            else:
-                # 创建空文件作为占位
-                filepath.touch()
+            # 截图数据直接从adb读取后写入文件，不经过shell重定向
+            data = await self.run_in_threadpool(self.adb.capture_screen_bytes)
+            if data:
+                await self.run_in_threadpool(filepath.write_bytes, data)
+                logger.info(f"截图已保存: {filepath}")
                 return filepath
         except Exception as e:
             logger.error(f"截图失败: {e}")
-            filepath.touch()
-            return filepath
+
+        # 截图失败时创建空文件作为占位
+        filepath.touch(exist_ok=True)
+        return filepath
+
+    @staticmethod
+    def _temp_screenshot_name(prefix: str) -> str:
+        """生成唯一的临时截图文件名"""
+        return f"temp_{prefix}_{uuid.uuid4().hex[:8]}.png"
+
+    def _cleanup_temp_screenshots(self):
+        """删除截图目录中残留的临时截图"""
+        for path in self.screenshots_dir.glob("temp_*.png"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
 
     async def input_text_async(self,
                                text: str,
@@ -631,6 +1096,7 @@ class AsyncADBHelper:
 
             # 使用ADB输入文本
             success = await self.run_in_threadpool(self.adb.input_text, text)
+            self._invalidate_match_cache()
             return success
 
         except Exception as e:
@@ -651,21 +1117,13 @@ class AsyncADBHelper:
             是否长按成功
         """
         try:
-            position = None
-
             # 获取位置
-            if isinstance(target, tuple) and len(target) == 2:
-                position = target
-            elif isinstance(target, (str, Path)):
-                result = await self.wait_element_async(str(target))
-                if hasattr(result, 'position') and result.position:
-                    position = result.position
-                elif isinstance(result, MatchResult) and result.success:
-                    position = result.position
+            position = await self._resolve_position_async(_classify(target))
 
             if position:
                 x, y = int(position[0]), int(position[1])
                 success = await self.run_in_threadpool(self.adb.long_press, x, y, duration)
+                self._invalidate_match_cache()
                 return success
             else:
                 logger.error(f"无法确定长按位置: {target}")
@@ -687,6 +1145,7 @@ class AsyncADBHelper:
         """
         try:
             success = await self.run_in_threadpool(self.adb.key_event, keycode)
+            self._invalidate_match_cache()
             return success
         except Exception as e:
             logger.error(f"按键事件失败: {e}")
@@ -753,8 +1212,11 @@ class AsyncADBHelper:
                     logger.warning(f"第 {attempt + 1} 次尝试未找到主目标")
                     continue
 
-                # 获取主目标位置
-                primary_pos_result = await self.exists_image_async(str(primary_target), primary_threshold)
+                # 获取主目标位置，同时获取屏幕尺寸
+                primary_pos_result, (screen_width, screen_height) = await asyncio.gather(
+                    self.exists_image_async(str(primary_target), primary_threshold),
+                    self.get_screen_size_async()
+                )
                 if not primary_pos_result.success:
                     continue
 
@@ -762,7 +1224,6 @@ class AsyncADBHelper:
 
                 # 2. 创建搜索区域
                 primary_x, primary_y = primary_pos_result.position
-                screen_width, screen_height = await self.get_screen_size_async()
 
                 search_region = (
                     max(0, int(primary_x) - search_region_expand),
@@ -803,38 +1264,66 @@ class AsyncADBHelper:
     async def _find_image_in_region_async(self,
                                           image_path: str,
                                           search_region: Tuple[int, int, int, int],
-                                          threshold: float = 0.7) -> Optional[MatchResult]:
+                                          threshold: float = 0.7,
+                                          frame: Optional[np.ndarray] = None) -> Optional[MatchResult]:
         """
         在指定区域内查找图片
 
         Args:
             image_path: 图片路径
             search_region: 搜索区域 (x1, y1, x2, y2)
-            threshold: 匹配阈值
+            threshold: 特征匹配的match_ratio（模板匹配使用TEMPLATE_MATCH_THRESHOLD）
+            frame: 已截取的画面，为None时重新截图
 
         Returns:
             匹配结果
         """
         try:
-            # 先截图
-            screenshot_path = await self.take_screenshot_async("temp_region_screenshot.png")
-
-            # 使用区域特征匹配
+            # 先截图，只保留搜索区域，缩小特征匹配的像素量
+            if frame is None:
+                frame = await self._grab_frame_ndarray()
+            if frame is None:
+                return MatchResult(success=False, error="截图失败")
+
+            x1, y1, x2, y2 = search_region
+            region = frame[y1:y2, x1:x2]
+            if region.size == 0:
+                return MatchResult(success=False, error="搜索区域为空")
+
+            # 搜索区域较小，先做模板匹配，相关系数足够高时直接返回，否则交给特征匹配
+            image_path = self._resolve_path(image_path)
+            template = await self.run_in_threadpool(self._load_template_gray, image_path)
+            if template is not None:
+                matched = await self.run_in_threadpool(match_template_roi, region, template)
+                if matched is not None and matched[0] >= TEMPLATE_MATCH_THRESHOLD:
+                    score, (tx, ty) = matched
+                    th, tw = template.shape[:2]
+                    return MatchResult(
+                        success=True,
+                        position=(x1 + tx + tw // 2, y1 + ty + th // 2),
+                        confidence=score,
+                        bbox=(x1 + tx, y1 + ty, x1 + tx + tw, y1 + ty + th)
+                    )
+
+            # 模板匹配失败时在区域图像上进行特征匹配（可处理缩放和形变）
             result, _, _ = await self.run_in_threadpool(
-                self.ocr.feature_match_in_region,
+                self.ocr.feature_match,
                 image_path,
-                str(screenshot_path),
-                search_region,
+                region,
                 match_ratio=threshold,
-                min_matches=5
+                min_matches=5,
+                draw_matches=False
             )
 
             if result and result.get('match_success', False):
+                # 坐标换算回整屏
+                cx, cy = result['center']
+                bx1, by1, bx2, by2 = result['bbox']
                 return MatchResult(
                     success=True,
-                    position=result['center'],
+                    position=(cx + x1, cy + y1),
                     confidence=result['confidence'],
-                    bbox=result['bbox']
+                    bbox=(bx1 + x1, by1 + y1, bx2 + x1, by2 + y1)
                 )
             else:
                 return MatchResult(success=False, confidence=0.0)
@@ -857,16 +1346,19 @@ class AsyncADBHelper:
             提取的文字结果列表
         """
         try:
-            # 截图
-            screenshot_path = await self.take_screenshot_async("temp_extract_screenshot.png")
+            # 截图（每次使用独立的临时文件，避免并发调用互相覆盖）
+            screenshot_path = await self.take_screenshot_async(self._temp_screenshot_name("extract"))
 
-            # 区域文字识别
-            results = await self.run_in_threadpool(
-                self.ocr.recognize_text_in_region,
-                str(screenshot_path),
-                region,
-                confidence_threshold
-            )
+            try:
+                # 区域文字识别
+                results = await self.run_in_threadpool(
+                    self.ocr.recognize_text_in_region,
+                    str(screenshot_path),
+                    region,
+                    confidence_threshold
+                )
+            finally:
+                screenshot_path.unlink(missing_ok=True)
 
             return results
 
@@ -894,19 +1386,22 @@ class AsyncADBHelper:
             找到的数字字符串
         """
         try:
-            # 截图
-            screenshot_path = await self.take_screenshot_async("temp_number_screenshot.png")
+            # 截图（每次使用独立的临时文件，避免并发调用互相覆盖）
+            screenshot_path = await self.take_screenshot_async(self._temp_screenshot_name("number"))
 
-            # 提取数字
-            numbers = await self.run_in_threadpool(
-                self.ocr.extract_numbers,
-                str(screenshot_path),
-                region,
-                number_pattern,
-                min_length,
-                max_length,
-                confidence_threshold
-            )
+            try:
+                # 提取数字
+                numbers = await self.run_in_threadpool(
+                    self.ocr.extract_numbers,
+                    str(screenshot_path),
+                    region,
+                    number_pattern,
+                    min_length,
+                    max_length,
+                    confidence_threshold
+                )
+            finally:
+                screenshot_path.unlink(missing_ok=True)
 
             if numbers:
                 return numbers[0].get('number')
@@ -929,24 +1424,28 @@ class AsyncADBHelper:
         Returns:
             结果字典
         """
-        tasks = []
-        for elem in elements:
-            target = elem.get('target')
+        results: List[Any] = [None] * len(elements)
+
+        async def _run(i: int, elem: Dict):
             config = elem.get('config', WaitConfig(timeout=timeout_per_element))
             strategy = elem.get('strategy', MatchStrategy.BOTH)
-            task = self.wait_element_async(target, config, strategy)
-            tasks.append(task)
+            try:
+                results[i] = await self.wait_element_async(elem.get('target'), config, strategy)
+            except Exception as e:
+                results[i] = e
 
-        # 并行执行所有等待任务
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 并行执行所有等待任务，异常在 _run 内捕获，不会取消其他任务
+        async with asyncio.TaskGroup() as tg:
+            for i, elem in enumerate(elements):
+                tg.create_task(_run(i, elem))
 
-        result_dict = {}
-        for i, (elem, result) in enumerate(zip(elements, results)):
-            elem_name = elem.get('name', f'element_{i}')
-            if isinstance(result, Exception):
-                result_dict[elem_name] = {'success': False, 'error': str(result)}
-            else:
-                result_dict[elem_name] = {'success': result, 'found': result}
+        result_dict = {
+            elem.get('name', f'element_{i}'): (
+                {'success': False, 'error': str(result)} if isinstance(result, Exception)
+                else {'success': result.success, 'found': result}
+            )
+            for i, (elem, result) in enumerate(zip(elements, results))
+        }
 
         return result_dict
 
@@ -967,23 +1466,20 @@ class AsyncADBHelper:
         Returns:
             是否找到
         """
+        swipe = self._make_invoker(swipe_action)
+        check = self._make_invoker(check_condition)
+
         for attempt in range(max_attempts):
             logger.info(f"第 {attempt + 1} 次尝试")
 
             # 执行滑动
-            if asyncio.iscoroutinefunction(swipe_action):
-                await swipe_action()
-            else:
-                await self.run_in_threadpool(swipe_action)
+            await swipe()
 
             # 等待动画
             await asyncio.sleep(wait_between)
 
             # 检查条件
-            if asyncio.iscoroutinefunction(check_condition):
-                found = await check_condition()
-            else:
-                found = await self.run_in_threadpool(check_condition)
+            found = await check()
 
             if found:
                 logger.info(f"第 {attempt + 1} 次尝试后找到目标")
@@ -1013,13 +1509,11 @@ class AsyncADBHelper:
         if operation_kwargs is None:
             operation_kwargs = {}
 
+        invoke = self._make_invoker(operation)
         last_exception = None
         for attempt in range(max_retries):
             try:
-                if asyncio.iscoroutinefunction(operation):
-                    return await operation(*operation_args, **operation_kwargs)
-                else:
-                    return await self.run_in_threadpool(operation, *operation_args, **operation_kwargs)
+                return await invoke(*operation_args, **operation_kwargs)
             except Exception as e:
                 last_exception = e
                 logger.warning(f"操作第 {attempt + 1} 次失败: {e}")
@@ -1059,10 +1553,7 @@ class AsyncADBHelper:
 
         # 执行操作
         try:
-            if asyncio.iscoroutinefunction(action):
-                await action(*action_args, **action_kwargs)
-            else:
-                await self.run_in_threadpool(action, *action_args, **action_kwargs)
+            await self._make_invoker(action)(*action_args, **action_kwargs)
             return True
         except Exception as e:
             logger.error(f"执行操作失败: {e}")
@@ -1083,6 +1574,8 @@ class AsyncADBHelper:
         if search_config is None:
             search_config = SearchConfig()
 
+        on_swipe = self._make_invoker(on_each_swipe) if on_each_swipe else None
+
         for swipe_count in range(search_config.max_swipes):
             # 执行滑动
             await self.swipe_in_direction_async(
@@ -1093,11 +1586,8 @@ class AsyncADBHelper:
             await asyncio.sleep(search_config.wait_between_swipes)
 
             # 执行回调
-            if on_each_swipe:
-                if asyncio.iscoroutinefunction(on_each_swipe):
-                    await on_each_swipe(swipe_count)
-                else:
-                    await self.run_in_threadpool(on_each_swipe, swipe_count)
+            if on_swipe:
+                await on_swipe(swipe_count)
 
             # 检查元素
             element = await self._find_element_in_current_screen_async(target, search_config)
@@ -1117,66 +1607,70 @@ class AsyncADBHelper:
             center_y: 中心点Y坐标
             search_radius: 搜索半径
         """
-        try:
-            # 获取屏幕大小
-            width, height = await self.get_screen_size_async()
-
-            # 计算搜索区域
-            search_region = (
-                max(0, center_x - search_radius),
-                max(0, center_y - search_radius),
-                min(width, center_x + search_radius),
-                min(height, center_y + search_radius)
-            )
+        # 不同头像类型的模板图片
+        avatar_templates = {
+            "self": [
+                "avatars/self_avatar_small.png",
+                "avatars/self_avatar_frame.png",
+                "avatars/player_icon.png"
+            ],
+            "teammate": [
+                "avatars/teammate_avatar_small.png",
+                "avatars/team_icon.png"
+            ],
+            "role": [
+                "avatars/role_avatar.png",
+                "avatars/character_icon.png"
+            ]
+        }
+
+        if avatar_type not in avatar_templates:
+            return False
 
-            logger.info(f"在区域 {search_region} 中搜索{avatar_type}头像")
-
-            # 不同头像类型的模板图片
-            avatar_templates = {
-                "self": [
-                    "avatars/self_avatar_small.png",
-                    "avatars/self_avatar_frame.png",
-                    "avatars/player_icon.png"
-                ],
-                "teammate": [
-                    "avatars/teammate_avatar_small.png",
-                    "avatars/team_icon.png"
-                ],
-                "role": [
-                    "avatars/role_avatar.png",
-                    "avatars/character_icon.png"
-                ]
-            }
-
-            if avatar_type not in avatar_templates:
+        try:
+            # 只保留存在的模板，结果按类型缓存，避免每次搜索都检查文件
+            templates = self._avatar_templates.get(avatar_type)
+            if templates is None:
+                templates = [path for path in (os.path.join(self.images_dir, t) for t in avatar_templates[avatar_type])
+                             if os.path.exists(path)]
+                self._avatar_templates[avatar_type] = templates
+
+            # 截图一次，所有模板和扩大后的搜索范围共用同一帧
+            frame = await self._grab_frame_ndarray()
+            if frame is None:
                 return False
+            height, width = frame.shape[:2]
 
-            # 尝试不同的头像模板
-            for template in avatar_templates[avatar_type]:
-                template_path = os.path.join(self.images_dir, template)
-                if not os.path.exists(template_path):
-                    continue
-
-                avatar_result = await self._find_image_in_region_async(
-                    template_path,
-                    search_region,
-                    threshold=0.7
+            while True:
+                # 计算搜索区域
+                search_region = (
+                    max(0, center_x - search_radius),
+                    max(0, center_y - search_radius),
+                    min(width, center_x + search_radius),
+                    min(height, center_y + search_radius)
                 )
 
-                if avatar_result and avatar_result.success:
-                    x, y = avatar_result.position
-                    logger.info(f"找到{avatar_type}头像，位置: ({x}, {y})")
-                    return await self.touch_async(avatar_result)
-
-            # 如果没找到，尝试扩大搜索范围
-            if search_radius < 100:  # 最大搜索半径
-                logger.info(f"扩大搜索范围到半径{search_radius + 30}")
-                return await self.click_avatar_in_region_async(
-                    avatar_type=avatar_type,
-                    center_x=center_x,
-                    center_y=center_y,
-                    search_radius=search_radius + 30
-                )
+                logger.info(f"在区域 {search_region} 中搜索{avatar_type}头像")
+
+                # 尝试不同的头像模板
+                for template_path in templates:
+                    avatar_result = await self._find_image_in_region_async(
+                        template_path,
+                        search_region,
+                        threshold=0.7,
+                        frame=frame
+                    )
+
+                    if avatar_result and avatar_result.success:
+                        x, y = avatar_result.position
+                        logger.info(f"找到{avatar_type}头像，位置: ({x}, {y})")
+                        return await self.touch_async(avatar_result)
+
+                # 如果没找到，尝试扩大搜索范围
+                if search_radius >= 100:  # 最大搜索半径
+                    break
+                search_radius += 30
+                logger.info(f"扩大搜索范围到半径{search_radius}")
 
             logger.warning(f"在半径{search_radius}内未找到{avatar_type}头像")
             return False
@@ -1204,11 +1698,7 @@ class AsyncADBHelper:
                 return None
 
             # 获取目标位置
-            pos_result = await self.exists_image_async(target_image)
-            if not pos_result.success:
-                return None
-
-            target_x, target_y = pos_result.position
+            target_x, target_y = target_result.position
 
             # 2. 计算数字区域
             x1 = target_x + number_region_offset[0]
@@ -1245,11 +1735,7 @@ class AsyncADBHelper:
                 return None
 
             # 获取目标位置
-            pos_result = await self.exists_image_async(target_image)
-            if not pos_result.success:
-                return None
-
-            target_x, target_y = pos_result.position
+            target_x, target_y = target_result.position
 
             # 2. 计算文本区域
             x1 = target_x + text_region_offset[0]
@@ -1280,9 +1766,7 @@ class AsyncADBHelper:
         Returns:
             任务结果
         """
-        task = asyncio.create_task(coro)
-        self.active_tasks.add(task)
-        task.add_done_callback(self.active_tasks.discard)
+        task = self._spawn(coro)
 
         try:
             if timeout:
@@ -1299,24 +1783,24 @@ class AsyncADBHelper:
     async def close(self):
         """关闭资源"""
         # 取消所有活跃任务
-        for task in self.active_tasks:
+        tasks = list(self.active_tasks)
+        for task in tasks:
             if not task.done():
                 task.cancel()
 
         # 等待任务完成
-        if self.active_tasks:
-            await asyncio.gather(*self.active_tasks, return_exceptions=True)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        # 关闭线程池
-        if self.thread_pool:
-            self.thread_pool.shutdown(wait=False)
-
-        # 断开ADB连接
+        # 断开ADB连接（线程池为所有实例共享，不在此关闭）
         try:
             await self.run_in_threadpool(self.adb.disconnect)
         except:
             pass
 
+        # 清理残留的临时截图
+        await self.run_in_threadpool(self._cleanup_temp_screenshots)
+
         logger.info("AsyncADBHelper已关闭")
 
         # 装饰器：将同步方法转换为异步
@@ -1330,8 +1814,8 @@ class AsyncADBHelper:
             if self and hasattr(self, 'run_in_threadpool'):
                 return await self.run_in_threadpool(func, *args, **kwargs)
             else:
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, partial(func, *args, **kwargs))
 
         return async_func
 
@@ -1340,8 +1824,25 @@ class AsyncADBHelper:
 class EnhancedAsyncADBHelper(AsyncADBHelper):
     """增强的异步助手，提供更多便捷方法"""
 
-    def __init__(self, emulator_port: int = 5555, ld_console_path: Optional[str] = None, max_workers: int = 5):
-        super().__init__(emulator_port=emulator_port, ld_console_path=ld_console_path, max_workers=max_workers)
+    def __init__(self, emulator_port: int = 5555, ld_console_path: Optional[str] = None, max_workers: int = 5,
+                 force_cpu: bool = False):
+        super().__init__(emulator_port=emulator_port, ld_console_path=ld_console_path, max_workers=max_workers,
+                         force_cpu=force_cpu)
+
+        # 各目标上次查找成功的策略 {目标: 策略}
+        self._strategy_winner: Dict[str, MatchStrategy] = {}
+
+    def invalidate_strategy_cache(self, target: Optional[str] = None):
+        """
+        清除多策略查找记录的成功策略
+
+        Args:
+            target: 要清除的目标，为None时全部清除
+        """
+        if target is None:
+            self._strategy_winner.clear()
+        else:
+            self._strategy_winner.pop(str(target), None)
 
     async def smart_wait_and_click_async(self,
                                          target: Union[str, Path],
@@ -1362,8 +1863,8 @@ class EnhancedAsyncADBHelper(AsyncADBHelper):
             wait_config = WaitConfig(timeout=15.0)
 
         # 自动判断目标类型
-        target_str = str(target)
-        if target_str.endswith(('.png', '.jpg', '.jpeg')):
+        resolved = _classify(target)
+        if resolved is not None and resolved.kind == TargetKind.IMAGE:
             strategy = MatchStrategy.IMAGE
         else:
             strategy = MatchStrategy.OCR
@@ -1373,8 +1874,8 @@ class EnhancedAsyncADBHelper(AsyncADBHelper):
         if not found:
             return False
 
-        # 点击
-        success = await self.touch_async(target)
+        # 点击（直接使用等待结果中的位置，无需再次识别）
+        success = await self.touch_async(found)
         if success and click_delay > 0:
             await asyncio.sleep(click_delay)
 
@@ -1401,16 +1902,21 @@ class EnhancedAsyncADBHelper(AsyncADBHelper):
         if wait_config is None:
             wait_config = WaitConfig(timeout=10.0)
 
+        # 上次成功的策略优先尝试
+        winner = self._strategy_winner.get(str(target))
+        if winner in strategies:
+            strategies = [winner] + [s for s in strategies if s != winner]
+
         for strategy in strategies:
             logger.info(f"尝试使用策略: {strategy}")
-            result = await self.wait_element_async(target, wait_config, strategy)
+            try:
+                result = await self.wait_element_async(target, wait_config, strategy)
+            except TimeoutError:
+                continue
 
             if result:
-                # 获取详细的匹配结果
-                if strategy == MatchStrategy.IMAGE:
-                    return await self.exists_image_async(target)
-                else:
-                    return await self.exists_text_async(target)
+                self._strategy_winner[str(target)] = strategy
+                return result
 
         return None
 
@@ -1431,24 +1937,23 @@ class EnhancedAsyncADBHelper(AsyncADBHelper):
         Returns:
             是否满足条件
         """
-        for i in range(max_swipes):
-            # 检查条件
-            if asyncio.iscoroutinefunction(condition_check):
-                condition_met = await condition_check()
-            else:
-                condition_met = await self.run_in_threadpool(condition_check)
+        check = self._make_invoker(condition_check)
+        swipe = self._make_invoker(swipe_action)
 
-            if condition_met:
+        for i in range(max_swipes + 1):
+            # 检查条件
+            if await check():
                 logger.info(f"滑动 {i} 次后条件满足")
                 return True
 
-            # 执行滑动
-            if asyncio.iscoroutinefunction(swipe_action):
-                await swipe_action()
-            else:
-                await self.run_in_threadpool(swipe_action)
+            if i == max_swipes:
+                break
 
-            await asyncio.sleep(check_interval)
+            # 滑动耗时计入检查间隔，但滑动结束后至少留出停稳时间，避免在滚动中途截图检查
+            started = time.monotonic()
+            await swipe()
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(check_interval - elapsed, min(check_interval, SWIPE_SETTLE_TIME)))
 
         logger.warning(f"滑动 {max_swipes} 次后条件仍未满足")
         return False
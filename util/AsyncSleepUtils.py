@@ -1,11 +1,15 @@
 import asyncio
-import random
 import time
 from typing import Union, Optional, List, Dict
 from dataclasses import dataclass
 from enum import Enum
 import logging
 
+import numpy as np
+
+# 预生成随机数的缓冲区大小（2的幂，便于按位取模）
+RNG_BUFFER_SIZE = 4096
+
 
 class SleepMode(Enum):
     """睡眠模式"""
@@ -49,20 +53,42 @@ class AsyncRandomSleeper:
         self.default_min = default_min
         self.default_max = default_max
 
-        # 统计信息
-        self.stats = {
-            'total_sleeps': 0,
-            'total_sleep_time': 0.0,
-            'min_sleep_time': float('inf'),
-            'max_sleep_time': 0.0
-        }
+        # 预生成的[0, 1)随机数，用完后重新生成
+        self._rng = np.random.default_rng()
+        self._rng_buf = self._rng.random(RNG_BUFFER_SIZE)
+        self._rng_idx = 0
+
+        # 统计信息 [次数, 总时间, 最短时间, 最长时间]
+        self._stats = np.array([0.0, 0.0, np.inf, 0.0], dtype=np.float64)
+
+    def _fast_uniform(self, lo: float, hi: float) -> float:
+        """从预生成的随机数中取值，返回[lo, hi)内的均匀分布随机数"""
+        r = self._rng_buf[self._rng_idx]
+        self._rng_idx = (self._rng_idx + 1) & (RNG_BUFFER_SIZE - 1)
+        if self._rng_idx == 0:
+            self._rng_buf = self._rng.random(RNG_BUFFER_SIZE)
+        return float(lo + (hi - lo) * r)
 
     def _update_stats(self, sleep_time: float):
         """更新统计信息"""
-        self.stats['total_sleeps'] += 1
-        self.stats['total_sleep_time'] += sleep_time
-        self.stats['min_sleep_time'] = min(self.stats['min_sleep_time'], sleep_time)
-        self.stats['max_sleep_time'] = max(self.stats['max_sleep_time'], sleep_time)
+        s = self._stats
+        s[0] += 1
+        s[1] += sleep_time
+        if sleep_time < s[2]:
+            s[2] = sleep_time
+        if sleep_time > s[3]:
+            s[3] = sleep_time
+
+    @property
+    def stats(self) -> Dict:
+        """统计信息字典（按需生成）"""
+        count, total, min_time, max_time = self._stats.tolist()
+        return {
+            'total_sleeps': int(count),
+            'total_sleep_time': total,
+            'min_sleep_time': min_time,
+            'max_sleep_time': max_time
+        }
 
     async def sleep_random(self,
                            min_time: Optional[float] = None,
@@ -74,7 +100,7 @@ class AsyncRandomSleeper:
         Args:
             min_time: 最小睡眠时间，默认1.0
             max_time: 最大睡眠时间，默认3.0
-            precision: 时间精度（小数位数）
+            precision: 时间精度（小数位数），仅为兼容保留，不再取整
 
         Returns:
             SleepResult: 睡眠结果
@@ -89,7 +115,7 @@ class AsyncRandomSleeper:
             raise ValueError(f"最小时间({min_time})不能大于最大时间({max_time})")
 
         # 生成随机睡眠时间
-        sleep_time = round(random.uniform(min_time, max_time), precision)
+        sleep_time = self._fast_uniform(min_time, max_time)
 
         return await self._sleep_impl(sleep_time, SleepMode.RANDOM)
 
@@ -108,7 +134,7 @@ class AsyncRandomSleeper:
         """
         if jitter > 0:
             # 添加抖动
-            sleep_time = random.uniform(time - jitter, time + jitter)
+            sleep_time = self._fast_uniform(time - jitter, time + jitter)
             sleep_time = max(0.1, sleep_time)  # 确保不小于0.1秒
         else:
             sleep_time = time
@@ -135,7 +161,7 @@ class AsyncRandomSleeper:
 
         # 添加随机抖动（10%）
         jitter = sleep_time * 0.1
-        sleep_time = random.uniform(sleep_time - jitter, sleep_time + jitter)
+        sleep_time = self._fast_uniform(sleep_time - jitter, sleep_time + jitter)
 
         # 限制最大时间
         sleep_time = min(sleep_time, max_time)
@@ -164,7 +190,7 @@ class AsyncRandomSleeper:
 
         # 添加随机抖动（10%）
         jitter = sleep_time * 0.1
-        sleep_time = random.uniform(sleep_time - jitter, sleep_time + jitter)
+        sleep_time = self._fast_uniform(sleep_time - jitter, sleep_time + jitter)
 
         # 限制最大时间
         sleep_time = min(sleep_time, max_time)
@@ -172,13 +198,31 @@ class AsyncRandomSleeper:
 
         return await self._sleep_impl(sleep_time, SleepMode.LINEAR)
 
-    async def _sleep_impl(self, sleep_time: float, mode: SleepMode) -> SleepResult:
+    async def sleep_many(self, times: List[float], mode: SleepMode = SleepMode.FIXED) -> SleepResult:
+        """
+        连续睡眠多段时间，合并为一次计时（只注册一个定时器）
+
+        Args:
+            times: 各段睡眠时间
+            mode: 睡眠模式（用于记录）
+
+        Returns:
+            SleepResult: 合并后的睡眠结果
+        """
+        if any(t < 0 for t in times):
+            raise ValueError("睡眠时间不能小于0")
+
+        return await self._sleep_impl(sum(times), mode, parts=times)
+
+    async def _sleep_impl(self, sleep_time: float, mode: SleepMode,
+                          parts: Optional[List[float]] = None) -> SleepResult:
         """
         睡眠实现
 
         Args:
             sleep_time: 睡眠时间
             mode: 睡眠模式
+            parts: 合并睡眠时的各段时间，统计按段记录
 
         Returns:
             SleepResult: 睡眠结果
@@ -186,7 +230,7 @@ class AsyncRandomSleeper:
         start_time = time.time()
 
         try:
-            self.logger.info(f"开始睡眠 [{mode.value}]，时间: {sleep_time:.2f}秒")
+            self.logger.info("开始睡眠 [%s]，时间: %.2f秒", mode.value, sleep_time)
 
             # 记录开始时间
             await asyncio.sleep(sleep_time)
@@ -196,9 +240,10 @@ class AsyncRandomSleeper:
             actual_sleep = end_time - start_time
 
             # 更新统计
-            self._update_stats(sleep_time)
+            for part in parts or (sleep_time,):
+                self._update_stats(part)
 
-            self.logger.info(f"睡眠完成，实际: {actual_sleep:.2f}秒")
+            self.logger.info("睡眠完成，实际: %.2f秒", actual_sleep)
 
             return SleepResult(
                 sleep_time=sleep_time,
@@ -245,7 +290,7 @@ class AsyncRandomSleeper:
 
     def get_stats(self) -> Dict:
         """获取统计信息"""
-        stats = self.stats.copy()
+        stats = self.stats
 
         if stats['total_sleeps'] > 0:
             stats['average_sleep_time'] = stats['total_sleep_time'] / stats['total_sleeps']
@@ -256,9 +301,4 @@ class AsyncRandomSleeper:
 
     def reset_stats(self):
         """重置统计信息"""
-        self.stats = {
-            'total_sleeps': 0,
-            'total_sleep_time': 0.0,
-            'min_sleep_time': float('inf'),
-            'max_sleep_time': 0.0
-        }
\ No newline at end of file
+        self._stats[:] = (0.0, 0.0, np.inf, 0.0)
\ No newline at end of file
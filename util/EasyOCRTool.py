@@ -31,6 +31,9 @@ class EasyOCRTool:
         self.reader = Reader(lang_list, gpu=gpu)
         self.logger = logger or self._setup_default_logger()
 
+        # 模板图片特征缓存 {(路径, 方法, 缩放, 增强对比度, 降噪): (修改时间, (关键点, 描述符, 尺寸))}
+        self._template_cache: Dict[tuple, Tuple[float, tuple]] = {}
+
     def _setup_default_logger(self) -> logging.Logger:
         """设置默认日志记录器"""
         logger = logging.getLogger('EasyOCRTool')
@@ -84,7 +87,8 @@ class EasyOCRTool:
                 img = cv2.cvtColor(np.array(image_input), cv2.COLOR_RGB2BGR)
                 return img
             elif isinstance(image_input, np.ndarray):
-                return image_input.copy()
+                # 已连续的数组直接返回视图，仅对切片等非连续数组做一次拷贝
+                return np.ascontiguousarray(image_input)
             else:
                 raise ValueError(f"不支持的图像格式: {type(image_input)}")
 
@@ -140,34 +144,27 @@ class EasyOCRTool:
         """
         try:
             # 加载图像
-            img1 = self.load_image(image1)
             img2 = self.load_image(image2)
 
             # 多尺度匹配初始化
             all_matches = []
             scale_ratios = scale_ratios or [1.0]  # 默认仅原尺度
 
-            for scale in scale_ratios:
-                # 缩放模板图像（image1）
-                if scale != 1.0:
-                    h, w = img1.shape[:2]
-                    scaled_img1 = cv2.resize(img1, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_CUBIC)
-                else:
-                    scaled_img1 = img1.copy()
+            # 选择鲁棒性更强的特征检测器
+            detector = self._get_feature_detector(method)
+            if detector is None:
+                self.logger.warning("特征检测器初始化失败，回退到AKAZE")
+                detector = cv2.AKAZE_create()
 
-                # 图像预处理
-                gray1 = self._image_preprocess(scaled_img1, enhance_contrast, denoise)
-                gray2 = self._image_preprocess(img2, enhance_contrast, denoise)
+            # 目标图像与缩放比例无关，只检测一次
+            gray2 = self._image_preprocess(img2, enhance_contrast, denoise)
+            kp2, des2 = detector.detectAndCompute(gray2, None)
 
-                # 选择鲁棒性更强的特征检测器
-                detector = self._get_feature_detector(method)
-                if detector is None:
-                    self.logger.warning("特征检测器初始化失败，回退到AKAZE")
-                    detector = cv2.AKAZE_create()
-
-                # 检测关键点和描述符（增加参数提升特征点质量）
-                kp1, des1 = detector.detectAndCompute(gray1, None)
-                kp2, des2 = detector.detectAndCompute(gray2, None)
+            for scale in scale_ratios:
+                # 检测模板关键点和描述符（模板为文件路径时使用缓存）
+                kp1, des1, (h, w) = self._get_template_features(
+                    image1, scale, method, detector, enhance_contrast, denoise
+                )
 
                 if des1 is None or des2 is None or len(kp1) < min_matches or len(kp2) < min_matches:
                     self.logger.warning(f"尺度{scale}: 特征点数量不足，跳过")
@@ -207,7 +204,6 @@ class EasyOCRTool:
                     continue
 
                 # 计算匹配区域
-                h, w = gray1.shape
                 pts = np.float32([[0, 0], [0, h - 1], [w - 1, h - 1], [w - 1, 0]]).reshape(-1, 1, 2)
                 dst = cv2.perspectiveTransform(pts, M)
 
@@ -280,6 +276,40 @@ class EasyOCRTool:
 
         return best_match, img_matches, img2_with_bbox
 
+    def _get_template_features(self,
+                               image1,
+                               scale: float,
+                               method: str,
+                               detector: cv2.Feature2D,
+                               enhance_contrast: bool,
+                               denoise: bool) -> tuple:
+        """
+        计算模板图像在指定缩放比例下的关键点和描述符，模板为文件路径时按修改时间缓存
+
+        Returns:
+            (关键点, 描述符, 预处理后图像的(高, 宽))
+        """
+        key = mtime = None
+        if isinstance(image1, str):
+            key = (image1, method.lower(), scale, enhance_contrast, denoise)
+            mtime = os.path.getmtime(image1)
+            cached = self._template_cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+        img1 = self.load_image(image1)
+        if scale != 1.0:
+            h, w = img1.shape[:2]
+            img1 = cv2.resize(img1, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_CUBIC)
+
+        gray1 = self._image_preprocess(img1, enhance_contrast, denoise)
+        kp1, des1 = detector.detectAndCompute(gray1, None)
+        features = (kp1, des1, gray1.shape[:2])
+
+        if key is not None:
+            self._template_cache[key] = (mtime, features)
+        return features
+
     def _get_feature_detector(self, method: str) -> cv2.Feature2D:
         """
         获取特征检测器（增加参数调优，提升特征鲁棒性）
@@ -4,7 +4,7 @@ import concurrent.futures
 import sys
 import os
 import time
-from typing import Optional, Tuple, List, Callable, Any, Dict, Union
+from typing import Optional, Tuple, List, Callable, Any, Dict, Union, Pattern
 from pathlib import Path
 import logging
 from dataclasses import dataclass
@@ -833,19 +833,19 @@ class EnhancedWindowsAsyncAirtestHelper(WindowsAsyncAirtestHelper):
     async def robust_connect_async(self,
                                    keywords: List[str],
                                    max_retries: int = 3,
-                                   retry_delay: float = 2.0) -> bool:
+                                   retry_delay: float = 2.0,
+                                   matcher: Optional[Pattern] = None) -> bool:
         """
         健壮的连接方法，包含重试机制
+
+        传入matcher（预编译的标题正则）时，每次尝试只枚举一次窗口，
+        用正则一次性匹配所有关键词，不再按关键词逐个查找
         """
         for attempt in range(max_retries):
             try:
                 logger.info(f"连接尝试 {attempt + 1}/{max_retries}")
 
-                for keyword in keywords:
-                    logger.info(f"尝试关键词: {keyword}")
-
-                    # 查找窗口
-                    windows = await self.find_windows_async(keyword, False)
+                async for windows in self._iter_candidate_windows(keywords, matcher):
                     if not windows:
                         continue
 
@@ -876,6 +876,20 @@ class EnhancedWindowsAsyncAirtestHelper(WindowsAsyncAirtestHelper):
         logger.error(f"所有 {max_retries} 次连接尝试都失败了")
         return False
 
+    async def _iter_candidate_windows(self, keywords: List[str], matcher: Optional[Pattern] = None):
+        """
+        逐组产出待连接的候选窗口
+        """
+        if matcher is not None:
+            all_windows = await self.list_all_windows_async()
+            yield [w for w in all_windows if matcher.search(w['title'])]
+            return
+
+        for keyword in keywords:
+            logger.info(f"尝试关键词: {keyword}")
+            # 查找窗口
+            yield await self.find_windows_async(keyword, False)
+
     async def smart_connect_async(self,
                                   keywords: List[str],
                                   exact_match: bool = False) -> bool:
@@ -9,6 +9,9 @@ import time
 import os
 from typing import Optional, Tuple
 
+# Windows下启动adb子进程时不弹出控制台窗口，其它平台为0
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
 
 class LeidianADB:
     def __init__(self, emulator_port: int = 5555, ld_console_path: Optional[str] = None):
@@ -374,6 +377,36 @@ class LeidianADB:
 
         return None
 
+    def capture_screen_bytes(self, timeout: float = 10.0) -> Optional[bytes]:
+        """
+        截取屏幕并直接返回PNG数据（不写入本地文件）
+
+        Args:
+            timeout: adb截图命令的超时时间(秒)
+
+        Returns:
+            PNG字节数据，失败返回None
+        """
+        if not self.connected:
+            if not self.connect():
+                return None
+
+        try:
+            result = subprocess.run(
+                [self.adb_path, '-s', f'127.0.0.1:{self.emulator_port}', 'exec-out', 'screencap', '-p'],
+                capture_output=True,
+                timeout=timeout,
+                creationflags=_CREATE_NO_WINDOW
+            )
+            if result.returncode == 0 and result.stdout:
+                return result.stdout
+        except subprocess.TimeoutExpired:
+            print(f"截图超时: {timeout}秒内未返回")
+        except Exception as e:
+            print(f"截图失败: {e}")
+
+        return None
+
     def long_press(self, x: int, y: int, duration: float = 1.0) -> bool:
         """
         长按操作